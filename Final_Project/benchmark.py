@@ -0,0 +1,390 @@
+"""Benchmarks for the AI engines on a fixed set of positions.
+
+Run from the Final_Project directory, for example:
+    python benchmark.py ordering --depth 6
+"""
+import argparse
+import os
+import random
+import time
+import numpy as np
+from game_logic import CheckersLogic
+from search import SearchContext, iterative_deepening, LateMoveReductions, DEFAULT_LMR
+from minimax import minimax_root
+from negamax import negamax_root, negamax_search
+from pvs import pvs_root
+from mtdf import mtdf_root
+from executors import BACKENDS, gil_disabled
+from parallel import get_pool
+from smp import get_pool as smp_pool
+from bitboard import Position
+from mcts import MCTSTree, get_pool as mcts_pool, mcts_search, select_leaf, simulate
+from rollout import batch_rollouts
+
+# Fixed benchmark positions, AI (white, "w") to move; "b" is a player man and capitals are kings
+BENCHMARK_POSITIONS = [
+    ("opening", [".b.b.b.b", "b.b.b.b.", ".b.b.b.b", "........", "........", "w.w.w.w.", ".w.w.w.w", "w.w.w.w."]),
+    ("early-1", [".b.b.b.b", "b.b.b.b.", "...b...b", "b.....b.", ".....w..", "w.w.w.w.", ".w.w.w.w", "w.w.w..."]),
+    ("early-2", [".b.b.b.b", "b.b.b.b.", ".....b.b", "b.b...w.", "........", "w.w.w...", ".w.w.w.w", "w.w.w.w."]),
+    ("early-3", [".b.b.b.b", "b.b.b.b.", ".b.b...b", "........", ".w.w.w.b", "....w...", ".w.w.w.w", "w.w.w.w."]),
+    ("middle-1", [".b.b.b..", "....b.b.", "...b...b", "w...b...", ".w...b.w", "..w.b.w.", ".w.w....", "....w.w."]),
+    ("middle-2", [".b.b.b..", "b...b.b.", ".b.b.b.w", "..w...w.", ".B.w....", "......w.", ".....w.w", "w.w....."]),
+    ("middle-3", [".b.b.b.b", "b.b.b.b.", ".b......", "......b.", ".w.w...b", "b.w.w.w.", ".w...w.w", "..w.w.w."]),
+]
+
+PIECE_CODES = {".": 0, "b": 1, "w": 2, "B": 3, "W": 4}
+
+def board_from_rows(rows):
+    """Build a NumPy board from eight row strings."""
+    return np.array([[PIECE_CODES[char] for char in row] for row in rows], dtype=int)
+
+def make_game(rows, depth, algorithm="minimax", **game_options):
+    """Create a game with a fresh transposition table set up on a benchmark position."""
+    game = CheckersLogic(depth, algorithm, **game_options)
+    game.board = board_from_rows(rows)
+    game.current_player = "ai"
+    return game
+
+def run_search(rows, depth, root_search, game_options=None, **context_options):
+    """Search a position to ``depth`` with iterative deepening and return (result, seconds)."""
+    game = make_game(rows, depth, **(game_options or {}))
+    ctx = SearchContext(game, **context_options)
+    start = time.perf_counter()
+    result = iterative_deepening(ctx, root_search, depth)
+    return result, time.perf_counter() - start
+
+def bench_ordering(depth):
+    """Compare nodes searched to reach ``depth`` with and without move ordering."""
+    print(f"Move ordering benchmark, depth {depth}")
+    print(f"{'position':<10} {'engine':<8} {'nodes (plain)':>14} {'nodes (ordered)':>16} {'ratio':>6}")
+    totals = {}
+    for name, rows in BENCHMARK_POSITIONS:
+        for engine, root_search in (("minimax", minimax_root), ("negamax", negamax_root)):
+            plain, _ = run_search(rows, depth, root_search, ordering=False)
+            ordered, _ = run_search(rows, depth, root_search, ordering=True)
+            totals.setdefault(engine, [0, 0])
+            totals[engine][0] += plain.nodes
+            totals[engine][1] += ordered.nodes
+            print(f"{name:<10} {engine:<8} {plain.nodes:>14} {ordered.nodes:>16} {ordered.nodes / plain.nodes:>6.2f}")
+    for engine, (plain_nodes, ordered_nodes) in totals.items():
+        print(f"{'total':<10} {engine:<8} {plain_nodes:>14} {ordered_nodes:>16} {ordered_nodes / plain_nodes:>6.2f}")
+
+def bench_root(depth):
+    """Compare nodes searched to reach ``depth`` with a fresh root window per move and with PVS at the root."""
+    print(f"Root window benchmark, depth {depth}")
+    print(f"{'position':<10} {'engine':<8} {'nodes (full)':>13} {'nodes (pvs)':>12} {'ratio':>6}  {'same score':>10}")
+    for name, rows in BENCHMARK_POSITIONS:
+        for engine, root_search in (("minimax", minimax_root), ("negamax", negamax_root)):
+            full, _ = run_search(rows, depth, root_search, pvs_root=False)
+            pvs, _ = run_search(rows, depth, root_search, pvs_root=True)
+            print(f"{name:<10} {engine:<8} {full.nodes:>13} {pvs.nodes:>12} {pvs.nodes / full.nodes:>6.2f}  "
+                  f"{str(full.score == pvs.score):>10}")
+
+def bench_pvs(depth):
+    """Compare negamax with principal variation search and aspiration windows, both deepening to ``depth``."""
+    print(f"Negamax vs PVS benchmark, iterative deepening to depth {depth}")
+    print(f"{'position':<10} {'negamax nodes':>14} {'pvs nodes':>10} {'negamax s':>10} {'pvs s':>7}  {'same score':>10}")
+    totals = [0, 0, 0.0, 0.0]
+    for name, rows in BENCHMARK_POSITIONS:
+        plain, plain_time = run_search(rows, depth, negamax_root)
+        pvs, pvs_time = run_search(rows, depth, pvs_root)
+        totals = [totals[0] + plain.nodes, totals[1] + pvs.nodes, totals[2] + plain_time, totals[3] + pvs_time]
+        print(f"{name:<10} {plain.nodes:>14} {pvs.nodes:>10} {plain_time:>10.3f} {pvs_time:>7.3f}  "
+              f"{str(abs(plain.score - pvs.score) < 1e-9):>10}")
+    print(f"{'total':<10} {totals[0]:>14} {totals[1]:>10} {totals[2]:>10.3f} {totals[3]:>7.3f}")
+
+def bench_mtdf(depth):
+    """Compare full-window negamax with MTD(f), both deepening to ``depth``."""
+    print(f"Negamax vs MTD(f) benchmark, iterative deepening to depth {depth}")
+    print(f"{'position':<10} {'negamax nodes':>14} {'mtdf nodes':>11} {'negamax s':>10} {'mtdf s':>7}  {'same score':>10}")
+    totals = [0, 0, 0.0, 0.0]
+    for name, rows in BENCHMARK_POSITIONS:
+        plain, plain_time = run_search(rows, depth, negamax_root)
+        mtdf, mtdf_time = run_search(rows, depth, mtdf_root)
+        totals = [totals[0] + plain.nodes, totals[1] + mtdf.nodes, totals[2] + plain_time, totals[3] + mtdf_time]
+        print(f"{name:<10} {plain.nodes:>14} {mtdf.nodes:>11} {plain_time:>10.3f} {mtdf_time:>7.3f}  "
+              f"{str(abs(plain.score - mtdf.score) < 1e-9):>10}")
+    print(f"{'total':<10} {totals[0]:>14} {totals[1]:>11} {totals[2]:>10.3f} {totals[3]:>7.3f}")
+
+def bench_parallel(depth, worker_counts, backends=("auto",)):
+    """Compare root-parallel minimax with the sequential search (both without reductions) by worker count."""
+    print(f"Root-parallel minimax benchmark, depth {depth}, {os.cpu_count()} CPUs, "
+          f"GIL {'disabled' if gil_disabled() else 'enabled'}")
+    sequential = [run_search(rows, depth, minimax_root, lmr=None) for _, rows in BENCHMARK_POSITIONS]
+    sequential_time = sum(seconds for _, seconds in sequential)
+    print(f"{'backend':<8} {'workers':>7} {'nodes':>8} {'seconds':>8} {'speedup':>8}  same move and score")
+    print(f"{'-':<8} {'seq':>7} {sum(result.nodes for result, _ in sequential):>8} {sequential_time:>8.3f} {1.0:>8.2f}")
+    for backend in backends:
+        # A single worker is the sequential search in the first row
+        for workers in [count for count in worker_counts if count > 1]:
+            # Start the pool outside the timed searches
+            get_pool(workers, backend)
+            runs = [run_search(rows, depth, minimax_root, workers=workers, game_options={"ai_backend": backend})
+                    for _, rows in BENCHMARK_POSITIONS]
+            seconds = sum(run_time for _, run_time in runs)
+            same = sum(run.move == base.move and run.score == base.score
+                       for (run, _), (base, _) in zip(runs, sequential))
+            print(f"{backend:<8} {workers:>7} {sum(run.nodes for run, _ in runs):>8} {seconds:>8.3f} "
+                  f"{sequential_time / seconds:>8.2f}  {same} of {len(BENCHMARK_POSITIONS)}")
+
+def bench_smp(depth, worker_counts):
+    """Compare time to ``depth`` of single-process negamax with Lazy SMP by worker count."""
+    print(f"Lazy SMP negamax benchmark, iterative deepening to depth {depth}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'main nodes':>11} {'seconds':>8} {'speedup':>8}  same move as 1 worker")
+    baseline = None
+    for workers in worker_counts:
+        if workers > 1:
+            # Start the helpers outside the timed searches
+            smp_pool(workers - 1)
+        moves = []
+        nodes = 0
+        seconds = 0.0
+        for _, rows in BENCHMARK_POSITIONS:
+            game = make_game(rows, depth, "negamax", ai_workers=workers, ai_parallel="smp")
+            start = time.perf_counter()
+            result = negamax_search(game, time_limit_ms=None)
+            seconds += time.perf_counter() - start
+            nodes += result.nodes
+            moves.append(result.move)
+        if baseline is None:
+            baseline = (seconds, moves)
+        same = sum(move == base for move, base in zip(moves, baseline[1]))
+        print(f"{workers:>7} {nodes:>11} {seconds:>8.3f} {baseline[0] / seconds:>8.2f}  {same} of {len(moves)}")
+
+def bench_mcts(time_limit_ms, worker_counts, backends=("auto",), strategies=("root",)):
+    """Report MCTS iterations per second, tree depth and root agreement by worker count, for a fixed time per position."""
+    print(f"Parallel MCTS benchmark, {time_limit_ms} ms per position, {os.cpu_count()} CPUs, "
+          f"GIL {'disabled' if gil_disabled() else 'enabled'}")
+    print(f"{'strategy':<8} {'backend':<8} {'workers':>7} {'iterations':>11} {'per second':>11} {'scaling':>8} "
+          f"{'max depth':>9}  same move as 1 worker")
+    baseline = None
+    for strategy in strategies:
+        # Tree parallelism always runs on threads
+        for backend in backends if strategy == "root" else ("thread",):
+            for workers in worker_counts:
+                if workers > 1 and strategy == "root":
+                    # Start the pool outside the timed searches
+                    mcts_pool(workers, backend)
+                iterations = depth = 0
+                seconds = 0.0
+                moves = []
+                for _, rows in BENCHMARK_POSITIONS:
+                    game = make_game(rows, 3, "mcts", ai_workers=workers, ai_parallel=strategy, ai_backend=backend)
+                    result = mcts_search(game, time_limit_ms)
+                    iterations += result.iterations
+                    seconds += result.time
+                    depth = max(depth, result.depth)
+                    moves.append(result.move)
+                rate = iterations / seconds
+                if baseline is None or workers == 1:
+                    baseline = (rate, moves)
+                same = sum(move == base for move, base in zip(moves, baseline[1]))
+                print(f"{strategy:<8} {backend:<8} {workers:>7} {iterations:>11} {rate:>11.0f} {rate / baseline[0]:>8.2f} "
+                      f"{depth:>9}  {same} of {len(moves)}")
+
+def bench_expand(time_limit_ms, thresholds):
+    """Report MCTS iterations per second, tree size and depth by expansion threshold, for a fixed time per position."""
+    print(f"MCTS expansion threshold benchmark, {time_limit_ms} ms per position")
+    print(f"{'threshold':>9} {'iterations':>11} {'per second':>11} {'speedup':>8} {'nodes':>8} {'max depth':>9}  "
+          f"same move as threshold 1")
+    baseline = None
+    for threshold in [1] + [value for value in thresholds if value != 1]:
+        iterations = nodes = depth = 0
+        seconds = 0.0
+        moves = []
+        for _, rows in BENCHMARK_POSITIONS:
+            game = make_game(rows, 3, "mcts", ai_expand_threshold=threshold)
+            result = mcts_search(game, time_limit_ms)
+            iterations += result.iterations
+            nodes += result.nodes
+            seconds += result.time
+            depth = max(depth, result.depth)
+            moves.append(result.move)
+        rate = iterations / seconds
+        if baseline is None:
+            baseline = (rate, moves)
+        same = sum(move == base for move, base in zip(moves, baseline[1]))
+        print(f"{threshold:>9} {iterations:>11} {rate:>11.0f} {rate / baseline[0]:>8.2f} {nodes:>8} {depth:>9}  "
+              f"{same} of {len(moves)}")
+
+def bench_rollouts(count, batch_sizes, time_limit_ms):
+    """Report rollouts per second one at a time and batched, then MCTS iterations per second by batch size."""
+    positions = [Position.from_board(board_from_rows(rows), "ai") for _, rows in BENCHMARK_POSITIONS]
+    game = make_game(BENCHMARK_POSITIONS[0][1], 3, "mcts")
+    print(f"Rollout benchmark, {count} rollouts per position")
+    print(f"{'batch':>6} {'rollouts/s':>11} {'speedup':>8} {'mean reward':>12}")
+    rng = random.Random(1)
+    start = time.perf_counter()
+    rewards = [simulate(game, position.copy(), rng) for position in positions for _ in range(count)]
+    baseline = len(rewards) / (time.perf_counter() - start)
+    print(f"{'single':>6} {baseline:>11.0f} {1:>8.2f} {sum(rewards) / len(rewards):>12.3f}")
+    generator = np.random.default_rng(1)
+    for batch_size in batch_sizes:
+        rewards = []
+        start = time.perf_counter()
+        for position in positions:
+            for first in range(0, count, batch_size):
+                rewards.extend(batch_rollouts([position] * min(batch_size, count - first), generator))
+        rate = len(rewards) / (time.perf_counter() - start)
+        print(f"{batch_size:>6} {rate:>11.0f} {rate / baseline:>8.2f} {sum(rewards) / len(rewards):>12.3f}")
+    
+    print(f"MCTS with batched rollouts, {time_limit_ms} ms per position")
+    print(f"{'batch':>6} {'iterations':>11} {'per second':>11} {'max depth':>9}  same move as batch 1")
+    baseline = None
+    for batch_size in [1] + [size for size in batch_sizes if size > 1]:
+        iterations = depth = 0
+        seconds = 0.0
+        moves = []
+        for _, rows in BENCHMARK_POSITIONS:
+            game = make_game(rows, 3, "mcts", ai_rollout_batch=batch_size)
+            result = mcts_search(game, time_limit_ms)
+            iterations += result.iterations
+            seconds += result.time
+            depth = max(depth, result.depth)
+            moves.append(result.move)
+        if baseline is None:
+            baseline = moves
+        same = sum(move == base for move, base in zip(moves, baseline))
+        print(f"{batch_size:>6} {iterations:>11} {iterations / seconds:>11.0f} {depth:>9}  {same} of {len(moves)}")
+
+def bench_mcts_overhead(iterations):
+    """Report the time MCTS spends per iteration outside rollouts, then per full iteration, by position.
+    
+    Tree overhead is measured with random rewards in place of rollouts, so it covers
+    selection (copying the root position, UCT and replaying moves), expansion and
+    backpropagation only.
+    """
+    print(f"MCTS per-iteration overhead, {iterations} iterations per position")
+    print(f"{'position':<10} {'select us':>10} {'backup us':>10} {'depth':>6} {'full iteration us':>18}")
+    for name, rows in BENCHMARK_POSITIONS:
+        rng = random.Random(1)
+        tree = MCTSTree(Position.from_board(board_from_rows(rows), "ai"), rng=rng)
+        selecting = backing_up = 0.0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            node = select_leaf(tree, tree.root.copy())
+            selected = time.perf_counter()
+            tree.backpropagate(node, rng.uniform(-1, 1))
+            selecting += selected - start
+            backing_up += time.perf_counter() - selected
+        result = mcts_search(make_game(rows, 3, "mcts"), node_limit=iterations)
+        print(f"{name:<10} {selecting / iterations * 1e6:>10.1f} {backing_up / iterations * 1e6:>10.1f} "
+              f"{tree.depth():>6} {result.time / result.iterations * 1e6:>18.1f}")
+
+def bench_quiescence(medium, hard, reference):
+    """Compare medium depth with quiescence against hard depth without it.
+    
+    Each search's move is checked against a deep reference search with quiescence.
+    """
+    print(f"Quiescence benchmark: depth {medium} + quiescence vs depth {hard} without, "
+          f"reference depth {reference} + quiescence")
+    print(f"{'position':<10} {'nodes d' + str(medium):>10} {'nodes d' + str(medium) + '+q':>12} "
+          f"{'nodes d' + str(hard):>10}  agrees with reference (d{medium} / d{medium}+q / d{hard})")
+    totals = [0, 0, 0]
+    agree = [0, 0, 0]
+    for name, rows in BENCHMARK_POSITIONS:
+        best, _ = run_search(rows, reference, negamax_root, quiescence=True)
+        runs = [run_search(rows, medium, negamax_root, quiescence=False)[0],
+                run_search(rows, medium, negamax_root, quiescence=True)[0],
+                run_search(rows, hard, negamax_root, quiescence=False)[0]]
+        matches = [run.move == best.move for run in runs]
+        for index, run in enumerate(runs):
+            totals[index] += run.nodes
+            agree[index] += matches[index]
+        print(f"{name:<10} {runs[0].nodes:>10} {runs[1].nodes:>12} {runs[2].nodes:>10}  "
+              f"{' / '.join('yes' if match else 'no' for match in matches)}")
+    print(f"{'total':<10} {totals[0]:>10} {totals[1]:>12} {totals[2]:>10}  "
+          f"{' / '.join(str(count) for count in agree)} of {len(BENCHMARK_POSITIONS)}")
+
+def bench_lmr(depth, lmr=DEFAULT_LMR):
+    """Compare searches to ``depth`` without late move reductions and with the ``lmr`` settings."""
+    print(f"Late move reduction benchmark, depth {depth}, min depth {lmr.min_depth}, "
+          f"full moves {lmr.full_moves}, reduction {lmr.reduction}")
+    print(f"{'position':<10} {'engine':<8} {'nodes (full)':>13} {'nodes (lmr)':>12} {'full s':>7} {'lmr s':>7}  "
+          f"{'same move':>9}")
+    engines = (("minimax", minimax_root), ("negamax", negamax_root), ("pvs", pvs_root))
+    totals = {engine: [0, 0, 0.0, 0.0, 0] for engine, _ in engines}
+    for name, rows in BENCHMARK_POSITIONS:
+        for engine, root_search in engines:
+            full, full_time = run_search(rows, depth, root_search, lmr=None)
+            reduced, reduced_time = run_search(rows, depth, root_search, lmr=lmr)
+            same = full.move == reduced.move
+            total = totals[engine]
+            totals[engine] = [total[0] + full.nodes, total[1] + reduced.nodes, total[2] + full_time,
+                              total[3] + reduced_time, total[4] + same]
+            print(f"{name:<10} {engine:<8} {full.nodes:>13} {reduced.nodes:>12} {full_time:>7.3f} {reduced_time:>7.3f}  "
+                  f"{'yes' if same else 'no':>9}")
+    for engine, (full_nodes, reduced_nodes, full_time, reduced_time, same) in totals.items():
+        print(f"{'total':<10} {engine:<8} {full_nodes:>13} {reduced_nodes:>12} {full_time:>7.3f} {reduced_time:>7.3f}  "
+              f"{same:>4} of {len(BENCHMARK_POSITIONS)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Checkers AI engines.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    ordering = subparsers.add_parser("ordering", help="node counts with and without move ordering")
+    ordering.add_argument("--depth", type=int, default=6)
+    root = subparsers.add_parser("root", help="node counts with and without root window sharing")
+    root.add_argument("--depth", type=int, default=6)
+    pvs = subparsers.add_parser("pvs", help="negamax against PVS with aspiration windows")
+    pvs.add_argument("--depth", type=int, default=8)
+    mtdf = subparsers.add_parser("mtdf", help="negamax against MTD(f)")
+    mtdf.add_argument("--depth", type=int, default=8)
+    parallel = subparsers.add_parser("parallel", help="root-parallel minimax against sequential, by worker count")
+    parallel.add_argument("--depth", type=int, default=7)
+    parallel.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parallel.add_argument("--backend", nargs="+", choices=BACKENDS, default=["auto"])
+    smp = subparsers.add_parser("smp", help="single-process negamax against Lazy SMP, by worker count")
+    smp.add_argument("--depth", type=int, default=8)
+    smp.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    mcts = subparsers.add_parser("mcts", help="root- and tree-parallel MCTS by worker count")
+    mcts.add_argument("--time-ms", type=int, default=500)
+    mcts.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    mcts.add_argument("--backend", nargs="+", choices=BACKENDS, default=["auto"])
+    mcts.add_argument("--strategy", nargs="+", choices=["root", "tree"], default=["root", "tree"])
+    expand = subparsers.add_parser("mcts-expand", help="MCTS iterations per second by expansion threshold")
+    expand.add_argument("--time-ms", type=int, default=500)
+    expand.add_argument("--threshold", type=int, nargs="+", default=[1, 2, 4, 8])
+    rollouts = subparsers.add_parser("rollouts", help="single against batched NumPy rollouts, and MCTS by batch size")
+    rollouts.add_argument("--count", type=int, default=512)
+    rollouts.add_argument("--batch", type=int, nargs="+", default=[16, 64, 256])
+    rollouts.add_argument("--time-ms", type=int, default=500)
+    overhead = subparsers.add_parser("mcts-overhead", help="MCTS time per iteration outside rollouts and in total")
+    overhead.add_argument("--iterations", type=int, default=5000)
+    quiet = subparsers.add_parser("quiescence", help="medium depth with quiescence against hard depth without")
+    quiet.add_argument("--medium", type=int, default=3)
+    quiet.add_argument("--hard", type=int, default=5)
+    quiet.add_argument("--reference", type=int, default=9)
+    lmr = subparsers.add_parser("lmr", help="node counts, time and best move with and without late move reductions")
+    lmr.add_argument("--depth", type=int, default=7)
+    lmr.add_argument("--min-depth", type=int, default=DEFAULT_LMR.min_depth)
+    lmr.add_argument("--full-moves", type=int, default=DEFAULT_LMR.full_moves)
+    lmr.add_argument("--reduction", type=int, default=DEFAULT_LMR.reduction)
+    args = parser.parse_args()
+    
+    if args.benchmark == "ordering":
+        bench_ordering(args.depth)
+    elif args.benchmark == "root":
+        bench_root(args.depth)
+    elif args.benchmark == "pvs":
+        bench_pvs(args.depth)
+    elif args.benchmark == "mtdf":
+        bench_mtdf(args.depth)
+    elif args.benchmark == "parallel":
+        bench_parallel(args.depth, args.workers, args.backend)
+    elif args.benchmark == "smp":
+        bench_smp(args.depth, args.workers)
+    elif args.benchmark == "mcts":
+        bench_mcts(args.time_ms, args.workers, args.backend, args.strategy)
+    elif args.benchmark == "mcts-expand":
+        bench_expand(args.time_ms, args.threshold)
+    elif args.benchmark == "rollouts":
+        bench_rollouts(args.count, args.batch, args.time_ms)
+    elif args.benchmark == "mcts-overhead":
+        bench_mcts_overhead(args.iterations)
+    elif args.benchmark == "quiescence":
+        bench_quiescence(args.medium, args.hard, args.reference)
+    elif args.benchmark == "lmr":
+        bench_lmr(args.depth, LateMoveReductions(args.min_depth, args.full_moves, args.reduction))
+
+if __name__ == "__main__":
+    main()
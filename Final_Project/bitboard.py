@@ -0,0 +1,229 @@
+from collections import namedtuple
+import numpy as np
+from zobrist import PIECE_KEYS, SIDE_KEY, hash_pieces
+
+BOARD_SIZE = 8
+NUM_SQUARES = 32
+
+# Piece codes used by the NumPy board in CheckersLogic
+EMPTY = 0
+PLAYER_MAN = 1
+AI_MAN = 2
+PLAYER_KING = 3
+AI_KING = 4
+
+# Row and column of each of the 32 dark squares, numbered row by row from the top-left
+ROW_OF = [sq // 4 for sq in range(NUM_SQUARES)]
+COL_OF = [(sq % 4) * 2 + (1 if (sq // 4) % 2 == 0 else 0) for sq in range(NUM_SQUARES)]
+
+# Bitboard of every square in each row, used for advancement scoring
+ROW_MASKS = [sum(1 << sq for sq in range(NUM_SQUARES) if ROW_OF[sq] == row) for row in range(BOARD_SIZE)]
+# Only (3, 4) and (4, 3) of the four centre squares are dark
+CENTER_MASK = (1 << (3 * 4 + 2)) | (1 << (4 * 4 + 1))
+
+# Same direction order as CheckersLogic.get_directions so search visits moves identically
+DIRECTIONS = {
+    PLAYER_MAN: [(1, -1), (1, 1)],
+    AI_MAN: [(-1, -1), (-1, 1)],
+    PLAYER_KING: [(-1, -1), (-1, 1), (1, -1), (1, 1)],
+    AI_KING: [(-1, -1), (-1, 1), (1, -1), (1, 1)],
+}
+
+# Squares on which each side's men are promoted
+PLAYER_PROMOTION_MASK = ROW_MASKS[BOARD_SIZE - 1]
+AI_PROMOTION_MASK = ROW_MASKS[0]
+
+# A move: origin and destination squares, bitboard of captured pieces, and the squares visited
+Move = namedtuple("Move", ["src", "dst", "captured", "path"])
+
+
+def square_of(row, col):
+    """Return the dark-square index of (row, col)."""
+    return row * 4 + col // 2
+
+
+def squares(bb):
+    """Return the square indices of the set bits of a bitboard, lowest first."""
+    result = []
+    while bb:
+        low = bb & -bb
+        result.append(low.bit_length() - 1)
+        bb ^= low
+    return result
+
+
+def other_side(side):
+    """Return the opponent of ``side``."""
+    return "player" if side == "ai" else "ai"
+
+
+class Position:
+    """Checkers position packed into bitboards over the 32 dark squares."""
+
+    __slots__ = ("black", "white", "kings", "side", "piece_squares", "man_count", "king_count", "key")
+
+    def __init__(self, black, white, kings, side="ai"):
+        # Player (black) pieces, AI (white) pieces and kings of either colour
+        self.black = black
+        self.white = white
+        self.kings = kings
+        # Side to move: "ai" or "player", as in CheckersLogic.current_player
+        self.side = side
+        # Per-side occupied squares and material counts, kept up to date by make_move/unmake_move
+        self.piece_squares = {"ai": set(squares(white)), "player": set(squares(black))}
+        self.man_count = {"ai": (white & ~kings).bit_count(), "player": (black & ~kings).bit_count()}
+        self.king_count = {"ai": (white & kings).bit_count(), "player": (black & kings).bit_count()}
+        # Zobrist key, updated incrementally by make_move and restored by unmake_move
+        self.key = hash_pieces(black, white, kings, side)
+
+    @classmethod
+    def from_board(cls, board, side="ai"):
+        """Build a position from the 8x8 NumPy board used by CheckersLogic."""
+        black = white = kings = 0
+        for sq in range(NUM_SQUARES):
+            piece = board[ROW_OF[sq]][COL_OF[sq]]
+            if piece == EMPTY:
+                continue
+            bit = 1 << sq
+            if piece in (PLAYER_MAN, PLAYER_KING):
+                black |= bit
+            else:
+                white |= bit
+            if piece in (PLAYER_KING, AI_KING):
+                kings |= bit
+        return cls(black, white, kings, side)
+
+    def to_board(self):
+        """Return the position as an 8x8 NumPy board."""
+        board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=int)
+        for sq in range(NUM_SQUARES):
+            piece = self.piece_at(sq)
+            if piece != EMPTY:
+                board[ROW_OF[sq]][COL_OF[sq]] = piece
+        return board
+
+    def copy(self):
+        """Return an independent copy of the position."""
+        # Copy the derived fields instead of recomputing them (and the Zobrist key) from the bitboards
+        child = Position.__new__(Position)
+        child.black = self.black
+        child.white = self.white
+        child.kings = self.kings
+        child.side = self.side
+        child.piece_squares = {"ai": set(self.piece_squares["ai"]), "player": set(self.piece_squares["player"])}
+        child.man_count = dict(self.man_count)
+        child.king_count = dict(self.king_count)
+        child.key = self.key
+        return child
+
+    def piece_at(self, sq):
+        """Return the board piece code on ``sq``."""
+        bit = 1 << sq
+        king = 2 if self.kings & bit else 0
+        if self.black & bit:
+            return PLAYER_MAN + king
+        if self.white & bit:
+            return AI_MAN + king
+        return EMPTY
+
+    def __eq__(self, other):
+        return (isinstance(other, Position) and self.black == other.black and self.white == other.white
+                and self.kings == other.kings and self.side == other.side)
+
+    def __hash__(self):
+        return self.key
+
+    def __repr__(self):
+        return f"Position(black={self.black:#x}, white={self.white:#x}, kings={self.kings:#x}, side={self.side!r})"
+
+
+def move_to_hops(move):
+    """Convert a move to the list of (from_row, from_col, to_row, to_col) hops the GUI plays one by one."""
+    return [(ROW_OF[a], COL_OF[a], ROW_OF[b], COL_OF[b]) for a, b in zip(move.path, move.path[1:])]
+
+
+def make_move(position, move):
+    """Play ``move`` on ``position`` in place and return the record needed to undo it.
+
+    The undo record is ``(move, captured_kings, promoted, key)``: the kings among
+    the captured pieces, whether the moving man was crowned, and the Zobrist key
+    before the move.
+    """
+    src_bit = 1 << move.src
+    dst_bit = 1 << move.dst
+    captured = move.captured
+    kings = position.kings
+    captured_kings = kings & captured
+    old_key = position.key
+    if position.black & src_bit:
+        mover, opponent = "player", "ai"
+        position.black = position.black & ~src_bit | dst_bit
+        position.white &= ~captured
+        promoted = not kings & src_bit and bool(dst_bit & PLAYER_PROMOTION_MASK)
+        man, opponent_man = PLAYER_MAN, AI_MAN
+    else:
+        mover, opponent = "ai", "player"
+        position.white = position.white & ~src_bit | dst_bit
+        position.black &= ~captured
+        promoted = not kings & src_bit and bool(dst_bit & AI_PROMOTION_MASK)
+        man, opponent_man = AI_MAN, PLAYER_MAN
+    if kings & src_bit:
+        kings = kings & ~src_bit | dst_bit
+        key = old_key ^ PIECE_KEYS[man + 2][move.src] ^ PIECE_KEYS[man + 2][move.dst]
+    elif promoted:
+        kings |= dst_bit
+        position.man_count[mover] -= 1
+        position.king_count[mover] += 1
+        key = old_key ^ PIECE_KEYS[man][move.src] ^ PIECE_KEYS[man + 2][move.dst]
+    else:
+        key = old_key ^ PIECE_KEYS[man][move.src] ^ PIECE_KEYS[man][move.dst]
+    position.kings = kings & ~captured
+    position.side = other_side(position.side)
+
+    own_squares = position.piece_squares[mover]
+    own_squares.remove(move.src)
+    own_squares.add(move.dst)
+    if captured:
+        captured_squares = squares(captured)
+        position.piece_squares[opponent].difference_update(captured_squares)
+        for sq in captured_squares:
+            key ^= PIECE_KEYS[opponent_man + 2 if captured_kings >> sq & 1 else opponent_man][sq]
+        captured_king_count = captured_kings.bit_count()
+        position.king_count[opponent] -= captured_king_count
+        position.man_count[opponent] -= captured.bit_count() - captured_king_count
+    position.key = key ^ SIDE_KEY
+    return (move, captured_kings, promoted, old_key)
+
+
+def unmake_move(position, undo):
+    """Restore ``position`` in place to its state before the move recorded in ``undo``."""
+    move, captured_kings, promoted, position.key = undo
+    src_bit = 1 << move.src
+    dst_bit = 1 << move.dst
+    captured = move.captured
+    position.side = other_side(position.side)
+    if position.black & dst_bit:
+        mover, opponent = "player", "ai"
+        position.black = position.black & ~dst_bit | src_bit
+        position.white |= captured
+    else:
+        mover, opponent = "ai", "player"
+        position.white = position.white & ~dst_bit | src_bit
+        position.black |= captured
+    kings = position.kings
+    if promoted:
+        kings &= ~dst_bit
+        position.man_count[mover] += 1
+        position.king_count[mover] -= 1
+    elif kings & dst_bit:
+        kings = kings & ~dst_bit | src_bit
+    position.kings = kings | captured_kings
+
+    own_squares = position.piece_squares[mover]
+    own_squares.remove(move.dst)
+    own_squares.add(move.src)
+    if captured:
+        position.piece_squares[opponent].update(squares(captured))
+        captured_king_count = captured_kings.bit_count()
+        position.king_count[opponent] += captured_king_count
+        position.man_count[opponent] += captured.bit_count() - captured_king_count
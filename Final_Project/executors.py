@@ -0,0 +1,27 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Ways to run parallel search workers: "auto" picks threads when the GIL is disabled and processes otherwise
+BACKENDS = ("auto", "thread", "process")
+
+def gil_disabled():
+    """Return True on a free-threaded CPython build (3.13t and later) running with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+def uses_threads(backend):
+    """Return whether workers of ``backend`` run as threads of this process rather than as processes."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parallel backend {backend!r}; expected one of {BACKENDS}")
+    if backend == "auto":
+        return gil_disabled()
+    return backend == "thread"
+
+def make_executor(workers, threads, initializer, initargs=()):
+    """Create a pool of ``workers`` threads or processes, each set up by ``initializer(*initargs)``.
+    
+    Threads share this process's memory, so tasks and results are passed without
+    pickling and the pool starts without launching interpreters.
+    """
+    executor = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    return executor(max_workers=workers, initializer=initializer, initargs=initargs)
\ No newline at end of file
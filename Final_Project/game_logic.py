@@ -2,13 +2,22 @@ import numpy as np
 from copy import deepcopy
 from minimax import minimax_move
 from negamax import negamax_move
+from pvs import pvs_move
+from mtdf import mtdf_move
 from mcts import mcts_move
 from utils import Constants, evaluate_board, is_terminal
+from bitboard import ROW_OF, COL_OF, square_of, move_to_hops
+from move_tables import STEPS, JUMPS
+from transposition import TranspositionTable
+from shared_transposition import SharedTranspositionTable
+from search import DEFAULT_LMR
 
 class CheckersLogic:
     """Manages the game logic and state for the Checkers game."""
     
-    def __init__(self, ai_difficulty, ai_algorithm):
+    def __init__(self, ai_difficulty, ai_algorithm, tt_size_mb=16, ai_time_limit_ms=None, ai_workers=1,
+                 ai_parallel="root", ai_backend="auto", ai_rollout_batch=1,
+                 ai_expand_threshold=1, ai_lmr=DEFAULT_LMR):
         self.board_size = 8
         self.square_size = 0
         self.board = self.create_initial_board()
@@ -19,6 +28,31 @@ class CheckersLogic:
         self.move_history = []
         self.ai_difficulty = ai_difficulty
         self.ai_algorithm = ai_algorithm
+        # Workers the search uses and how: "root" splits root moves (minimax, negamax) or grows independent
+        # trees (MCTS), "smp" runs Lazy SMP helpers (negamax) over a transposition table in shared memory,
+        # "tree" has MCTS threads share one tree
+        self.ai_workers = ai_workers
+        self.ai_parallel = ai_parallel
+        # Whether root-parallel workers are threads or processes: "auto" uses threads when the GIL is disabled
+        self.ai_backend = ai_backend
+        # Leaves MCTS selects before simulating them together with batched NumPy rollouts; 1 simulates each at once
+        self.ai_rollout_batch = ai_rollout_batch
+        # Visits an MCTS leaf needs before its moves are listed and its children created
+        self.ai_expand_threshold = ai_expand_threshold
+        # Shared by the alpha-beta engines and kept across moves; sized by a memory budget in MB
+        if ai_parallel == "smp" and ai_workers > 1:
+            self.transposition_table = SharedTranspositionTable(tt_size_mb)
+        else:
+            self.transposition_table = TranspositionTable(tt_size_mb)
+        # LateMoveReductions settings of the alpha-beta engines, or None to search every move to full depth
+        self.ai_lmr = ai_lmr
+        # Optional per-move time budget in ms; None searches to the difficulty's fixed depth or iteration count
+        self.ai_time_limit_ms = ai_time_limit_ms
+        # SearchResult of the last alpha-beta search (move, score, depth reached, nodes, time, PV, root scores),
+        # or MCTSResult of the last MCTS search (move, iterations, tree nodes, depth, time, reused visits)
+        self.last_search = None
+        # MCTS tree of the last search, whose subtree the next search continues from
+        self.mcts_tree = None
     
     def create_initial_board(self):
         """Create initial board setup."""
@@ -35,28 +69,7 @@ class CheckersLogic:
     
     def get_valid_moves(self, row, col):
         """Get valid moves for a piece."""
-        piece = self.board[row][col]
-        moves = []
-        captures = []
-        
-        directions = self.get_directions(piece)
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            if 0 <= r < self.board_size and 0 <= c < self.board_size:
-                if self.is_opponent_piece(piece, self.board[r][c]):
-                    r2, c2 = r + dr, c + dc
-                    if 0 <= r2 < self.board_size and 0 <= c2 < self.board_size and self.board[r2][c2] == 0:
-                        captures.append((r2, c2))
-        
-        if captures:
-            return captures
-        
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            if 0 <= r < self.board_size and 0 <= c < self.board_size and self.board[r][c] == 0:
-                moves.append((r, c))
-        
-        return moves
+        return self.get_valid_moves_for_board(self.board, row, col)
     
     def get_directions(self, piece):
         """Return valid move directions for a piece."""
@@ -86,9 +99,11 @@ class CheckersLogic:
             additional_captures = self.get_valid_moves(to_row, to_col)
             has_additional_captures = any(abs(to_row - r) == 2 for r, c in additional_captures)
             
-            if has_additional_captures and self.current_player == "player":
-                self.selected_piece = (to_row, to_col)
-                self.valid_moves = [move for move in additional_captures if abs(to_row - move[0]) == 2]
+            if has_additional_captures:
+                # The player picks the next jump in the GUI; the AI plays its whole chain hop by hop
+                if self.current_player == "player":
+                    self.selected_piece = (to_row, to_col)
+                    self.valid_moves = [move for move in additional_captures if abs(to_row - move[0]) == 2]
                 self.move_history.append({
                     'player': player,
                     'from': (from_row, from_col),
@@ -118,39 +133,39 @@ class CheckersLogic:
             move = minimax_move(self)
         elif self.ai_algorithm == "negamax":
             move = negamax_move(self)
+        elif self.ai_algorithm == "pvs":
+            move = pvs_move(self)
+        elif self.ai_algorithm == "mtdf":
+            move = mtdf_move(self)
         else:
             move = mcts_move(self)
         
         print(f"AI move time: {time.time() - start_time:.2f}s")
-        return move
+        if self.ai_algorithm in ("minimax", "negamax", "pvs", "mtdf") and self.last_search:
+            print(f"Search depth: {self.last_search.depth}, nodes: {self.last_search.nodes}, "
+                  f"transposition table hit rate: {self.transposition_table.hit_rate():.1%}, "
+                  f"stores: {self.transposition_table.stores}, usage: {self.transposition_table.usage():.1%}")
+        elif self.ai_algorithm == "mcts" and self.last_search:
+            print(f"MCTS iterations: {self.last_search.iterations} "
+                  f"({self.last_search.iterations / max(self.last_search.time, 1e-9):.0f}/s), "
+                  f"tree nodes: {self.last_search.nodes}, depth: {self.last_search.depth}, "
+                  f"visits reused: {self.last_search.reused}")
+        # Engines return a bitboard move; the GUI plays it as a list of single hops
+        return move_to_hops(move) if move else None
     
     def get_valid_moves_for_board(self, board, row, col):
         """Get valid moves for a piece on a given board."""
         piece = board[row][col]
-        moves = []
-        captures = []
-        
-        directions = self.get_directions(piece)
-        for dr, dc in directions:
-            r = row + dr
-            c = col + dc
-            if 0 <= r < self.board_size and 0 <= c < self.board_size:
-                if self.is_opponent_piece(piece, board[r][c]):
-                    r2 = r + dr
-                    c2 = c + dc
-                    if 0 <= r2 < self.board_size and 0 <= c2 < self.board_size and board[r2][c2] == 0:
-                        captures.append((r2, c2))
+        square = square_of(row, col)
         
+        # Neighbour and jump squares come from the precomputed tables; only occupancy is checked here
+        captures = [(ROW_OF[land], COL_OF[land]) for over, land in JUMPS[piece][square]
+                    if self.is_opponent_piece(piece, board[ROW_OF[over]][COL_OF[over]])
+                    and board[ROW_OF[land]][COL_OF[land]] == 0]
         if captures:
             return captures
         
-        for dr, dc in directions:
-            r = row + dr
-            c = col + dc
-            if 0 <= r < self.board_size and 0 <= c < self.board_size and board[r][c] == 0:
-                moves.append((r, c))
-        
-        return moves
+        return [(ROW_OF[dst], COL_OF[dst]) for dst in STEPS[piece][square] if board[ROW_OF[dst]][COL_OF[dst]] == 0]
     
     def check_game_over(self):
         """Check for game over conditions."""
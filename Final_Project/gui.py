@@ -65,7 +65,7 @@ class CheckersGUI:
         algo_frame = ttk.Frame(input_frame)
         algo_frame.pack(pady=10, fill=tk.X)
         ttk.Label(algo_frame, text="AI Algorithm:").pack(side=tk.LEFT)
-        algorithms = [("Minimax", "minimax"), ("Negamax", "negamax"), ("Monte Carlo TS", "mcts")]
+        algorithms = [("Minimax", "minimax"), ("Negamax", "negamax"), ("PVS", "pvs"), ("MTD(f)", "mtdf"), ("Monte Carlo TS", "mcts")]
         for text, algo in algorithms:
             ttk.Radiobutton(algo_frame, text=text, variable=self.algorithm, value=algo).pack(side=tk.LEFT, padx=10)
         
@@ -129,7 +129,7 @@ class CheckersGUI:
         """Show settings window to change difficulty or algorithm."""
         settings_window = tk.Toplevel(self.master)
         settings_window.title("Settings")
-        settings_window.geometry("300x300")
+        settings_window.geometry("300x360")
         settings_window.transient(self.master)
         settings_window.grab_set()
         
@@ -143,7 +143,7 @@ class CheckersGUI:
         
         ttk.Label(frame, text="AI Algorithm:").pack(anchor=tk.W, pady=(10, 0))
         algo_var = tk.StringVar(value=self.algorithm.get())
-        algorithms = [("Minimax", "minimax"), ("Negamax", "negamax"), ("Monte Carlo TS", "mcts")]
+        algorithms = [("Minimax", "minimax"), ("Negamax", "negamax"), ("PVS", "pvs"), ("MTD(f)", "mtdf"), ("Monte Carlo TS", "mcts")]
         for text, algo in algorithms:
             ttk.Radiobutton(frame, text=text, variable=algo_var, value=algo).pack(anchor=tk.W)
         
@@ -310,8 +310,9 @@ class CheckersGUI:
         
         move = self.game_logic.ai_move()
         if move:
-            from_row, from_col, to_row, to_col = move
-            self.game_logic.make_move(from_row, from_col, to_row, to_col, "AI")
+            # Play every hop of the move so multi-jump captures are completed
+            for from_row, from_col, to_row, to_col in move:
+                self.game_logic.make_move(from_row, from_col, to_row, to_col, "AI")
             self.draw_board()
             # Update status after the move to reflect the new current player (usually player)
             self.update_status()
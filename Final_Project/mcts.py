@@ -1,171 +1,496 @@
+import math
 import random
+import threading
+import time
+from collections import namedtuple
 import numpy as np
-from copy import deepcopy
-from utils import evaluate_board, is_terminal
-
-class MCTSNode:
-    """Node for Monte Carlo Tree Search."""
-    
-    def __init__(self, board, move, parent, game):
-        # Initialize the node with a deep copy of the game board to prevent modifying the original
-        self.board = deepcopy(board)
-        # Store the move that led to this node (tuple of start_row, start_col, end_row, end_col); None for root
-        self.move = move
-        # Reference to the parent node; None for the root node
-        self.parent = parent
-        # List to store child nodes, each representing a possible move from this state
-        self.children = []
-        # Counter for the number of times this node has been visited during MCTS iterations
-        self.visits = 0
-        # Accumulated reward from simulations, representing wins or scaled evaluation scores
-        self.wins = 0
-        # Reference to the game object, providing access to board size, rules, and utility functions
-        self.game = game
-    
-    def is_terminal(self):
-        """Check if node is terminal."""
-        # Check if the current board state is terminal (game over, e.g., no pieces or no valid moves)
-        # Uses the is_terminal function from utils to evaluate the board
-        return is_terminal(self.game, self.board)
-    
-    def expand(self):
-        """Expand node by adding children for all possible moves."""
-        # Identify all AI pieces (2 for regular, 4 for king) on the current board
-        pieces = [(r, c) for r in range(self.game.board_size) for c in range(self.game.board_size) if self.board[r][c] in (2, 4)]
-        # Iterate through each AI piece to find valid moves
-        for row, col in pieces:
-            # Get all valid moves for the piece at (row, col) using the game's utility function
-            moves = self.game.get_valid_moves_for_board(self.board, row, col)
-            # Iterate through each valid move (destination coordinates)
-            for move_row, move_col in moves:
-                # Create a deep copy of the current board to simulate the move
-                new_board = deepcopy(self.board)
-                # Clear the piece's original position
-                new_board[row][col] = 0
-                # Move the piece to the new position
-                new_board[move_row][move_col] = self.board[row][col]
-                # Check if the move is a capture (jump over an opponent)
-                if abs(row - move_row) == 2:
-                    # Calculate the position of the captured piece (midpoint between start and end)
-                    captured_row = (row + move_row) // 2
-                    captured_col = (col + move_col) // 2
-                    # Remove the captured piece from the board
-                    new_board[captured_row][captured_col] = 0
-                # Promote the AI piece to a king if it reaches the opponent's end row (row 0)
-                if new_board[move_row][move_col] == 2 and move_row == 0:
-                    new_board[move_row][move_col] = 4
-                # Create a new child node for this move and add it to the children list
-                self.children.append(MCTSNode(new_board, (row, col, move_row, move_col), self, self.game))
-    
-    def simulate(self):
-        """Simulate a random game from this node."""
-        # Create a deep copy of the current board to simulate a random game without affecting the node
-        current_board = deepcopy(self.board)
-        # Start with the AI as the current player (since this node represents an AI move)
-        current_player = 'ai'
-        # Limit the simulation to a maximum number of moves to prevent infinite loops
-        max_steps = 50
+from bitboard import Position, make_move
+from executors import make_executor, uses_threads
+from movegen import generate_moves, pack_move, unpack_move
+from rollout import batch_rollouts
+from utils import evaluate_board
+
+# Exploration constant of the UCT (Upper Confidence Bound for Trees) formula
+EXPLORATION = 1.414
+
+# Outcome of an MCTS search: the most visited root move, iterations run, nodes in the tree, depth of the deepest
+# node, seconds taken and root visits carried over from the previous turn's tree
+MCTSResult = namedtuple("MCTSResult", ["move", "iterations", "nodes", "depth", "time", "reused"])
+
+# Virtual loss added along a path while a tree-parallel rollout from it is pending (rewards lie in [-1, 1])
+VIRTUAL_LOSS = 1.0
+
+# Root-parallel pools by (worker count, threads)
+_pools = {}
+
+# Per-worker state (thread-local for thread workers): the game rollouts are evaluated against
+_worker = threading.local()
+
+class MCTSTree:
+    """Monte Carlo search tree stored as NumPy arrays indexed by node number.
+    
+    Node 0 is the root. A node's children occupy the consecutive slots
+    first_child .. first_child + child_count - 1, and nodes hold no positions:
+    the position of a node is rebuilt by replaying the moves from the root.
+    Each node costs 32 bytes.
+    
+    Children are created lazily, one per visit: a node's legal moves are listed
+    once it has ``expand_threshold`` visits (the root at once), with a slot reserved
+    for each, and every later visit turns one untried move into a child until
+    none are left.
+    """
+    
+    def __init__(self, root, expand_threshold=1, rng=random, capacity=4096):
+        # Bitboard position at the root; the only position the tree keeps
+        self.root = root
+        # Source of randomness for move order and rollouts: the random module or a seeded random.Random
+        self.rng = rng
+        # Visits a leaf needs before its moves are listed; until then it is only simulated
+        self.expand_threshold = expand_threshold
+        # Untried moves of nodes that are not fully expanded; an empty list marks a terminal node
+        self.untried = {}
+        # Index of each node's parent; -1 for the root
+        self.parent = np.full(capacity, -1, dtype=np.int32)
+        # Move that led to each node, packed with pack_move; 0 for the root
+        self.move = np.zeros(capacity, dtype=np.uint64)
+        # Number of times each node was visited during MCTS iterations
+        self.visits = np.zeros(capacity, dtype=np.int32)
+        # Accumulated reward, from the perspective of the side that made the node's move
+        self.value = np.zeros(capacity, dtype=np.float64)
+        # Index of each node's first child slot and the number of children created so far
+        self.first_child = np.full(capacity, -1, dtype=np.int32)
+        self.child_count = np.zeros(capacity, dtype=np.int32)
+        # Number of slots in use
+        self.size = 1
+        # Moves by packed word, so selection does not unpack the same move again at every visit
+        self.moves = {}
+    
+    def _grow(self, needed):
+        """Enlarge the arrays to hold at least ``needed`` nodes, doubling the capacity."""
+        capacity = len(self.parent)
+        while capacity < needed:
+            capacity *= 2
+        extra = capacity - len(self.parent)
+        self.parent = np.concatenate([self.parent, np.full(extra, -1, dtype=np.int32)])
+        self.move = np.concatenate([self.move, np.zeros(extra, dtype=np.uint64)])
+        self.visits = np.concatenate([self.visits, np.zeros(extra, dtype=np.int32)])
+        self.value = np.concatenate([self.value, np.zeros(extra, dtype=np.float64)])
+        self.first_child = np.concatenate([self.first_child, np.full(extra, -1, dtype=np.int32)])
+        self.child_count = np.concatenate([self.child_count, np.zeros(extra, dtype=np.int32)])
+    
+    def add_moves(self, node, moves):
+        """Record ``moves`` as the untried moves of ``node`` and reserve a slot for each future child."""
+        # Tried in random order: shuffle once, then take from the end
+        self.rng.shuffle(moves)
+        self.untried[node] = moves
+        start = self.size
+        end = start + len(moves)
+        if end > len(self.parent):
+            self._grow(end)
+        self.first_child[node] = start
+        self.size = end
+        return moves
+    
+    def expand(self, node):
+        """Materialize the child of ``node`` for one of its untried moves and return (child, move)."""
+        untried = self.untried[node]
+        move = untried.pop()
+        child = self.first_child[node] + self.child_count[node]
+        self.parent[child] = node
+        word = pack_move(move)
+        self.move[child] = word
+        self.moves[word] = move
+        self.child_count[node] += 1
+        # Fully expanded: selection takes over (a node without any moves keeps its empty list as terminal)
+        if not untried:
+            del self.untried[node]
+        return child, move
+    
+    def select_child(self, node):
+        """Select the child of ``node`` with the highest UCT value.
         
-        # Run the simulation for up to max_steps
-        for _ in range(max_steps):
-            # Check if the current board state is terminal (game over)
-            if is_terminal(self.game, current_board):
-                # Evaluate the board from the AI's perspective
-                score = evaluate_board(self.game, current_board)
-                # Return 1 for AI win (positive score), -1 for loss (negative score), or 0 for draw
-                return 1 if score > 0 else -1 if score < 0 else 0
-            
-            # Determine piece types based on the current player (AI: 2, 4; opponent: 1, 3)
-            piece_types = (2, 4) if current_player == 'ai' else (1, 3)
-            # Identify all pieces belonging to the current player on the board
-            pieces = [(r, c) for r in range(self.game.board_size) for c in range(self.game.board_size) 
-                      if current_board[r][c] in piece_types]
-            # If no pieces are left, the current player loses (AI: -1, opponent: 1)
-            if not pieces:
-                return -1 if current_player == 'ai' else 1
-            
-            # Randomly select a piece to move
-            row, col = random.choice(pieces)
-            # Get all valid moves for the selected piece
-            moves = self.game.get_valid_moves_for_board(current_board, row, col)
-            # If no moves are available, the current player loses
-            if not moves:
-                return -1 if current_player == 'ai' else 1
-            
-            # Randomly select a move from the valid moves
-            move_row, move_col = random.choice(moves)
-            # Clear the piece's original position
-            current_board[row][col] = 0
-            # Move the piece to the new position
-            current_board[move_row][move_col] = current_board[row][col]
-            # Handle capture if the move is a jump
-            if abs(row - move_row) == 2:
-                # Calculate the captured piece's position
-                captured_row = (row + move_row) // 2
-                captured_col = (col + move_col) // 2
-                # Remove the captured piece
-                current_board[captured_row][captured_col] = 0
-            # Promote AI piece to king if it reaches the opponent's end row
-            if current_board[move_row][move_col] == 2 and move_row == 0:
-                current_board[move_row][move_col] = 4
-            # Promote opponent piece to king if it reaches the AI's end row
-            elif current_board[move_row][move_col] == 1 and move_row == self.game.board_size - 1:
-                current_board[move_row][move_col] = 3
-            # Switch the current player (AI to player, or player to AI)
-            current_player = 'player' if current_player == 'ai' else 'ai'
+        Every child has been visited: select_leaf simulates a child in the iteration
+        that creates it, and the visit is counted before any other selection runs.
+        """
+        start = self.first_child[node]
+        end = start + self.child_count[node]
+        visits = self.visits[start:end].tolist()
+        values = self.value[start:end].tolist()
+        # UCT = (value/visits) + exploration * sqrt(2 * ln(parent_visits) / visits), in plain floats;
+        # the parent's log term is computed once per call
+        log_visits = 2 * math.log(self.visits[node])
+        best, best_uct = 0, -math.inf
+        for index, count in enumerate(visits):
+            uct = values[index] / count + EXPLORATION * math.sqrt(log_visits / count)
+            if uct > best_uct:
+                best, best_uct = index, uct
+        return start + best
+    
+    def play(self, position, node):
+        """Play the move that led to ``node`` on ``position`` in place."""
+        make_move(position, self.moves[int(self.move[node])])
+    
+    def add_virtual_loss(self, node, loss):
+        """Count a pending visit to ``node`` and its ancestors and score it as a loss of ``loss`` until backed up."""
+        while node >= 0:
+            self.visits[node] += 1
+            self.value[node] -= loss
+            node = self.parent[node]
+    
+    def backpropagate(self, node, reward, virtual_loss=0.0):
+        """Add ``reward`` to ``node`` and its ancestors, negating it at each level for the alternating players.
         
-        # If the simulation reaches max_steps, evaluate the board and scale the score
-        # The score is divided by 10 to normalize it for backpropagation
-        return evaluate_board(self.game, current_board) / 10
-    
-    def backpropagate(self, reward):
-        """Backpropagate simulation results."""
-        # Increment the visit counter for this node
-        self.visits += 1
-        # Add the simulation reward to the node's accumulated wins
-        self.wins += reward
-        # If this node has a parent, propagate the negated reward upwards
-        # Negation accounts for alternating players (AI vs. opponent)
-        if self.parent:
-            self.parent.backpropagate(-reward)
-    
-    def select_child(self):
-        """Select child node using UCT formula."""
-        # Define the exploration constant for the UCT (Upper Confidence Bound for Trees) formula
-        exploration = 1.414
-        # Select the child with the highest UCT value, balancing exploitation and exploration
-        # UCT = (wins/visits) + exploration * sqrt(2 * ln(parent_visits) / visits)
-        # If visits is 0, return infinity to prioritize unvisited nodes
-        return max(self.children, key=lambda c: (c.wins / c.visits if c.visits > 0 else 0) + 
-                   exploration * (2 * np.log(self.visits) / c.visits)**0.5 if c.visits > 0 else float('inf'))
-
-def mcts_move(game):
+        With ``virtual_loss`` the visit was already counted by add_virtual_loss, whose loss is removed.
+        """
+        while node >= 0:
+            if virtual_loss:
+                self.value[node] += reward + virtual_loss
+            else:
+                self.visits[node] += 1
+                self.value[node] += reward
+            reward = -reward
+            node = self.parent[node]
+    
+    def node_count(self):
+        """Return the number of nodes created, the root included."""
+        return 1 + int(self.child_count[:self.size].sum())
+    
+    def depth(self):
+        """Return the depth of the deepest node, the root being at depth 0."""
+        # A child's slot always comes after its parent's, so one pass in slot order suffices
+        depths = [0] * self.size
+        parent = self.parent[:self.size].tolist()
+        for node in range(1, self.size):
+            # Reserved slots of untried moves have no parent yet
+            if parent[node] >= 0:
+                depths[node] = depths[parent[node]] + 1
+        return max(depths)
+    
+    def root_statistics(self):
+        """Return {packed move: (visits, value)} for the root's children."""
+        start = self.first_child[0]
+        end = start + self.child_count[0]
+        return {int(move): (int(visits), float(value))
+                for move, visits, value in zip(self.move[start:end], self.visits[start:end], self.value[start:end])}
+    
+    def best_move(self):
+        """Return the move of the most visited root child, or None if the root has no children."""
+        if not self.child_count[0]:
+            return None
+        start = self.first_child[0]
+        best = start + int(np.argmax(self.visits[start:start + self.child_count[0]]))
+        return unpack_move(int(self.move[best]))
+    
+    def find(self, position, max_depth=2):
+        """Return the node at most ``max_depth`` plies below the root whose position is ``position``, or None."""
+        frontier = [(0, self.root)]
+        for depth in range(max_depth + 1):
+            deeper = []
+            for node, current in frontier:
+                if current.key == position.key and current == position:
+                    return node
+                if depth < max_depth:
+                    start = self.first_child[node]
+                    for child in range(start, start + self.child_count[node]):
+                        child_position = current.copy()
+                        self.play(child_position, child)
+                        deeper.append((child, child_position))
+            frontier = deeper
+        return None
+    
+    def subtree(self, node, position):
+        """Return a new tree made of ``node`` and its descendants, rooted at ``position`` (the node's position).
+        
+        Statistics, untried moves and reserved slots carry over; nodes are renumbered
+        in breadth-first order, which keeps every node's children consecutive.
+        """
+        tree = MCTSTree(position, self.expand_threshold, self.rng, len(self.parent))
+        tree.moves = self.moves
+        # Old node numbers in the order of their new numbers; the new number of node queue[i] is i
+        queue = [node]
+        renumbered = {node: 0}
+        for old in queue:
+            new = renumbered[old]
+            tree.visits[new] = self.visits[old]
+            tree.value[new] = self.value[old]
+            # Never expanded: no moves listed and no slots reserved
+            if self.first_child[old] < 0:
+                continue
+            count = int(self.child_count[old])
+            untried = self.untried.get(old)
+            if untried is not None:
+                tree.untried[new] = untried
+            start = tree.size
+            tree.size += count + len(untried or ())
+            tree.first_child[new] = start
+            tree.child_count[new] = count
+            old_start = self.first_child[old]
+            for index in range(count):
+                renumbered[old_start + index] = start + index
+                tree.parent[start + index] = new
+                tree.move[start + index] = self.move[old_start + index]
+                queue.append(old_start + index)
+        return tree
+
+def simulate(game, position, rng=random):
+    """Simulate a random game from ``position``, played in place, and return its reward for the AI."""
+    # Limit the simulation to a maximum number of moves to prevent infinite loops
+    max_steps = 50
+    
+    # Run the simulation for up to max_steps
+    for _ in range(max_steps):
+        # Get every legal move of the side to move
+        moves = generate_moves(position, position.side)
+        # If no moves are available (including no pieces left), the current player loses (AI: -1, opponent: 1)
+        if not moves:
+            return -1 if position.side == 'ai' else 1
+        
+        # Randomly select a move and play it in place; this also switches the side to move
+        make_move(position, rng.choice(moves))
+    
+    # If the simulation reaches max_steps, evaluate the position and scale the score
+    # The score is divided by 10 to normalize it for backpropagation
+    return evaluate_board(game, position) / 10
+
+def mcts_move(game, time_limit_ms=None, node_limit=None, expand_threshold=None, batch_size=None):
     """Monte Carlo Tree Search for AI move."""
-    # Create the root node for the current game board, with no move or parent
-    root = MCTSNode(game.board, None, None, game)
-    # Set the number of MCTS iterations based on AI difficulty (800 for hard, 400 for easy/medium)
-    iterations = 800 if game.ai_difficulty >= 3 else 400
-    
-    # Perform the specified number of MCTS iterations
-    for _ in range(iterations):
-        # Start at the root node
-        node = root
-        # Traverse the tree by selecting the best child (via UCT) until a leaf or terminal node is reached
-        while node.children and not node.is_terminal():
-            node = node.select_child()
-        # If the node is not terminal, expand it by adding child nodes for all possible moves
-        if not node.is_terminal():
-            node.expand()
-            # If children were added, randomly select one for simulation
-            if node.children:
-                node = random.choice(node.children)
-        # Simulate a random game from the selected node to estimate its value
-        reward = node.simulate()
-        # Backpropagate the simulation reward up the tree to update visits and wins
-        node.backpropagate(reward)
-    
-    # Select the child node with the most visits as the best move
-    best_child = max(root.children, key=lambda c: c.visits) if root.children else None
-    # Return the move associated with the best child (start_row, start_col, end_row, end_col)
-    # Return None if no valid move is found (e.g., no children)
-    return best_child.move if best_child and best_child.move else None
\ No newline at end of file
+    return mcts_search(game, time_limit_ms, node_limit, expand_threshold, batch_size).move
+
+def mcts_search(game, time_limit_ms=None, node_limit=None, expand_threshold=None, batch_size=None):
+    """Run MCTS from the game position and return an MCTSResult.
+    
+    The search stops after ``time_limit_ms`` milliseconds (argument or
+    ``game.ai_time_limit_ms``) or ``node_limit`` iterations, whichever comes first;
+    each iteration simulates one leaf node. With neither it runs 400 iterations,
+    or 800 from difficulty 3. At least one iteration always runs, and the move
+    returned is the most visited root move so far. With ``game.ai_workers`` > 1
+    the workers grow independent trees that share the budget (root parallelism),
+    or threads grow one tree together when ``game.ai_parallel`` is "tree".
+    
+    A leaf's moves are listed once it has ``expand_threshold`` visits (argument or
+    ``game.ai_expand_threshold``); see MCTSTree.
+    
+    With ``batch_size`` (argument or ``game.ai_rollout_batch``) above 1, each tree
+    selects that many leaves before simulating them together; tree-parallel threads
+    still simulate one leaf at a time.
+    
+    The tree is kept in ``game.mcts_tree`` for the next turn, which continues from
+    the subtree of the position then on the board (see reuse_tree). Root-parallel
+    trees stay in their workers and are not reused.
+    """
+    start = time.perf_counter()
+    if time_limit_ms is None:
+        time_limit_ms = game.ai_time_limit_ms
+    if expand_threshold is None:
+        expand_threshold = game.ai_expand_threshold
+    if batch_size is None:
+        batch_size = game.ai_rollout_batch
+    # Set the number of MCTS iterations based on AI difficulty (800 for hard, 400 for easy/medium) without a budget
+    if time_limit_ms is None and node_limit is None:
+        node_limit = 800 if game.ai_difficulty >= 3 else 400
+    deadline = start + time_limit_ms / 1000 if time_limit_ms is not None else None
+    
+    if game.ai_workers > 1 and game.ai_parallel != "tree":
+        game.mcts_tree = None
+        move, iterations, nodes, depth = root_parallel_search(game, deadline, node_limit, expand_threshold,
+                                                               batch_size)
+        reused = 0
+    else:
+        # Continue from the previous turn's subtree for the current game board, or start a new tree
+        tree = reuse_tree(game, expand_threshold)
+        reused = int(tree.visits[0])
+        if game.ai_workers > 1:
+            iterations = tree_parallel_search(game, tree, deadline, node_limit)
+        else:
+            iterations = run_iterations(tree, game, deadline, node_limit, batch_size)
+        game.mcts_tree = tree
+        # The root child with the most visits; None if no valid move is found (e.g., no children)
+        move = tree.best_move()
+        nodes = tree.node_count()
+        depth = tree.depth()
+    result = MCTSResult(move, iterations, nodes, depth, time.perf_counter() - start, reused)
+    game.last_search = result
+    return result
+
+def reuse_tree(game, expand_threshold=1):
+    """Return the tree to search the game board from, with the AI to move.
+    
+    When the previous search's tree (``game.mcts_tree``) holds the position, usually
+    two plies down after the AI's move and the player's reply, its subtree becomes
+    the new tree and keeps its statistics. Otherwise a new tree is created.
+    """
+    position = Position.from_board(game.board, "ai")
+    previous = game.mcts_tree
+    if previous is not None and previous.expand_threshold == expand_threshold:
+        node = previous.find(position)
+        if node is not None:
+            return previous.subtree(node, position)
+    return MCTSTree(position, expand_threshold)
+
+def select_leaf(tree, position):
+    """Walk from the root to the node to simulate, playing its moves on ``position``, and return the node.
+    
+    Descends by UCT through fully expanded nodes and stops at a new child created
+    for an untried move, at a leaf with too few visits to expand, or at a terminal node.
+    """
+    node = 0
+    while True:
+        untried = tree.untried.get(node)
+        # A leaf that has never been expanded lists its moves once it has been visited often enough
+        if untried is None and not tree.child_count[node]:
+            if node and tree.visits[node] < tree.expand_threshold:
+                return node
+            untried = tree.add_moves(node, generate_moves(position, position.side))
+        # Create one child for an untried move and simulate from it
+        if untried:
+            node, move = tree.expand(node)
+            make_move(position, move)
+            return node
+        # No moves at all (cached as an empty untried list): the node is terminal
+        if not tree.child_count[node]:
+            return node
+        # Fully expanded: descend to the best child (via UCT)
+        node = tree.select_child(node)
+        tree.play(position, node)
+
+def rollout_reward(game, position, rng=random):
+    """Simulate from ``position`` and return the reward for the side that made the move into it."""
+    # Rewards are from the AI's perspective; flip them when the player made the move into the leaf
+    flip = position.side == 'ai'
+    # Simulate a random game from the selected node to estimate its value
+    reward = simulate(game, position, rng)
+    return -reward if flip else reward
+
+def run_iterations(tree, game, deadline=None, node_limit=None, batch_size=1):
+    """Run MCTS iterations on ``tree`` until the perf_counter() deadline or the iteration limit; return the count.
+    
+    With ``batch_size`` above 1, iterations run in batches: leaves are selected one
+    after another, each path holding a virtual loss so the next selection is steered
+    elsewhere, then simulated together by batch_rollouts and backed up.
+    """
+    if batch_size > 1:
+        return _run_batches(tree, deadline, node_limit, batch_size)
+    iterations = 0
+    while True:
+        # Select a node on a copy of the root position, simulate from it and back the result up the tree
+        position = tree.root.copy()
+        node = select_leaf(tree, position)
+        tree.backpropagate(node, rollout_reward(game, position, tree.rng))
+        
+        iterations += 1
+        if node_limit is not None and iterations >= node_limit:
+            return iterations
+        if deadline is not None and time.perf_counter() >= deadline:
+            return iterations
+
+def _run_batches(tree, deadline, node_limit, batch_size):
+    """Run MCTS iterations on ``tree`` in batches of ``batch_size`` simulated together; return the count."""
+    # NumPy generator for the batched rollouts, seeded from the tree's generator so seeded searches repeat
+    rng = np.random.default_rng(tree.rng.getrandbits(64))
+    iterations = 0
+    while True:
+        size = batch_size if node_limit is None else min(batch_size, node_limit - iterations)
+        nodes, positions = [], []
+        for _ in range(size):
+            position = tree.root.copy()
+            node = select_leaf(tree, position)
+            tree.add_virtual_loss(node, VIRTUAL_LOSS)
+            nodes.append(node)
+            positions.append(position)
+        rewards = batch_rollouts(positions, rng)
+        for node, position, reward in zip(nodes, positions, rewards):
+            # Rewards are from the AI's perspective; flip them when the player made the move into the leaf
+            tree.backpropagate(node, -reward if position.side == 'ai' else reward, VIRTUAL_LOSS)
+        
+        iterations += size
+        if node_limit is not None and iterations >= node_limit:
+            return iterations
+        if deadline is not None and time.perf_counter() >= deadline:
+            return iterations
+
+def tree_parallel_search(game, tree, deadline, node_limit):
+    """Grow ``tree`` with ``game.ai_workers`` threads and return the number of iterations run.
+    
+    A thread holds the tree lock only to select and expand a leaf and to back up
+    its result; rollouts run unlocked. While a rollout is pending, its path carries
+    a virtual loss, so threads selecting meanwhile are steered onto other paths.
+    """
+    lock = threading.Lock()
+    # Iterations started, shared so an iteration limit counts every thread's work
+    started = [0]
+    
+    def work(seed):
+        rng = random.Random(seed)
+        while True:
+            with lock:
+                if node_limit is not None and started[0] >= node_limit:
+                    return
+                started[0] += 1
+                position = tree.root.copy()
+                node = select_leaf(tree, position)
+                tree.add_virtual_loss(node, VIRTUAL_LOSS)
+            reward = rollout_reward(game, position, rng)
+            with lock:
+                tree.backpropagate(node, reward, VIRTUAL_LOSS)
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+    
+    # Seeds come from the random module, so random.seed() fixes each thread's rollouts
+    threads = [threading.Thread(target=work, args=(random.getrandbits(32),)) for _ in range(game.ai_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return started[0]
+
+def _init_worker():
+    """Set up a pool worker with the game object rollouts are evaluated against."""
+    # Imported here because game_logic imports this module
+    from game_logic import CheckersLogic
+    # Rollouts only need the evaluation, so the game's transposition table gets a single slot
+    _worker.game = CheckersLogic(0, "mcts", tt_size_mb=0)
+
+def get_pool(workers, backend="auto"):
+    """Return the pool of ``workers`` workers of ``backend`` for root-parallel MCTS, starting it on first use."""
+    threads = uses_threads(backend)
+    if (workers, threads) not in _pools:
+        _pools[workers, threads] = make_executor(workers, threads, _init_worker)
+    return _pools[workers, threads]
+
+def _search_tree(board, seed, deadline, node_limit, expand_threshold, batch_size):
+    """Pool task: grow one tree from ``board`` and return (root statistics, iterations, nodes, depth).
+    
+    The root statistics map each root move, packed, to its (visits, value).
+    """
+    tree = MCTSTree(Position.from_board(board, "ai"), expand_threshold, random.Random(seed))
+    iterations = run_iterations(tree, _worker.game, deadline, node_limit, batch_size)
+    return tree.root_statistics(), iterations, tree.node_count(), tree.depth()
+
+def root_parallel_search(game, deadline, node_limit, expand_threshold, batch_size=1):
+    """Grow ``game.ai_workers`` independent trees with different seeds and return (move, iterations, nodes, depth).
+    
+    The trees share the budget: each runs until the deadline, and an iteration limit
+    is split evenly between them. Their root visit counts and values are summed per
+    move, and the move with the most visits overall is chosen.
+    """
+    workers = game.ai_workers
+    pool = get_pool(workers, game.ai_backend)
+    limit = -(-node_limit // workers) if node_limit is not None else None
+    # Seeds come from the random module, so random.seed() still makes a search repeatable
+    futures = [pool.submit(_search_tree, game.board, random.getrandbits(32), deadline, limit, expand_threshold,
+                           batch_size)
+               for _ in range(workers)]
+    totals = {}
+    iterations = nodes = depth = 0
+    for future in futures:
+        statistics, tree_iterations, tree_nodes, tree_depth = future.result()
+        iterations += tree_iterations
+        nodes += tree_nodes
+        depth = max(depth, tree_depth)
+        for move, (visits, value) in statistics.items():
+            total = totals.get(move, (0, 0.0))
+            totals[move] = (total[0] + visits, total[1] + value)
+    if not totals:
+        return None, iterations, nodes, depth
+    best = max(totals, key=lambda move: totals[move][0])
+    return unpack_move(best), iterations, nodes, depth
\ No newline at end of file
@@ -1,123 +1,138 @@
-from copy import deepcopy
-from utils import evaluate_board, is_terminal
+from bitboard import make_move, unmake_move
+from movegen import generate_moves
+from parallel import parallel_root
+from search import SearchContext, iterative_deepening, search_root, quiescence, MAX_DEPTH, NULL_WINDOW
+from transposition import probe_window, store_result
+from utils import evaluate_board, WIN_SCORE
 
-def minimax_move(game):
+def minimax_move(game, time_limit_ms=None):
     """Minimax algorithm for AI move."""
-    # Initialize best score to negative infinity and best move to None
-    best_score = -float('inf')
-    best_move = None
-    # Get all AI pieces (regular pieces = 2, kings = 4)
-    ai_pieces = [(r, c) for r in range(game.board_size) for c in range(game.board_size) if game.board[r][c] in (2, 4)]
+    return minimax_search(game, time_limit_ms).move
+
+def minimax_search(game, time_limit_ms=None):
+    """Search the game position with minimax and return a SearchResult.
     
-    # Iterate through all AI pieces
-    for row, col in ai_pieces:
-        # Get valid moves for the current piece
-        moves = game.get_valid_moves(row, col)
-        # Iterate through all possible moves for the current piece
-        for move_row, move_col in moves:
-            # Create a deep copy of the board to simulate the move
-            temp_board = deepcopy(game.board)
-            # Clear the original position
-            temp_board[row][col] = 0
-            # Move the piece to the new position
-            temp_board[move_row][move_col] = game.board[row][col]
-            # Check if the move is a capture (jump)
-            if abs(row - move_row) == 2:
-                # Calculate the captured piece's position (midpoint)
-                captured_row = (row + move_row) // 2
-                captured_col = (col + move_col) // 2
-                # Remove the captured piece
-                temp_board[captured_row][captured_col] = 0
-            # Check if the piece should be promoted to a king
-            if temp_board[move_row][move_col] == 2 and move_row == 0:
-                temp_board[move_row][move_col] = 4
-            # Evaluate the move using minimax with reduced depth
-            score = minimax(game, temp_board, game.ai_difficulty - 1, -float('inf'), float('inf'), False)
-            # Update best score and move if this move is better
-            if score > best_score:
-                best_score = score
-                best_move = (row, col, move_row, move_col)
+    Without a time limit the search runs to depth ``game.ai_difficulty``. With one
+    (argument or ``game.ai_time_limit_ms``) it deepens 1, 2, 3, ... until the budget
+    in milliseconds runs out and reports the deepest completed iteration.
+    """
+    if time_limit_ms is None:
+        time_limit_ms = game.ai_time_limit_ms
+    ctx = SearchContext(game, lmr=game.ai_lmr, workers=game.ai_workers)
+    # Age the previous move's entries and reset the table statistics
+    ctx.table.new_search()
+    if time_limit_ms is None:
+        result = iterative_deepening(ctx, minimax_root, game.ai_difficulty, start_depth=game.ai_difficulty)
+    else:
+        result = iterative_deepening(ctx, minimax_root, MAX_DEPTH, time_limit_ms)
+    game.last_search = result
+    return result
+
+def minimax_root(ctx, depth):
+    """Search every AI move to ``depth`` and return a RootResult.
     
-    # Return the best move found
-    return best_move
+    With ``ctx.workers`` > 1 the root moves are searched over a thread or process pool.
+    """
+    if ctx.workers > 1:
+        return parallel_root(ctx, depth, minimax_child)
+    return search_root(ctx, depth, minimax_child)
+
+def minimax_child(ctx, position, depth, alpha, beta):
+    """Score the position after an AI root move (the player to move) from the AI's perspective."""
+    return minimax(ctx, position, depth, alpha, beta, False)
 
-def minimax(game, board, depth, alpha, beta, maximizing_player):
-    """Minimax with alpha-beta pruning."""
-    # Base case: if depth is 0 or the board is in a terminal state, return evaluation
-    if depth == 0 or is_terminal(game, board):
-        return evaluate_board(game, board)
+def minimax(ctx, position, depth, alpha, beta, maximizing_player, ply=1):
+    """Minimax with alpha-beta pruning and a transposition table."""
+    # Count the node; this raises SearchTimeout once the time budget is spent
+    ctx.count_node()
+    # Base case: if depth is 0, resolve pending captures or return evaluation
+    if depth == 0:
+        if ctx.quiescence:
+            # Quiescence works from the side to move's perspective; convert the window and score
+            if maximizing_player:
+                return quiescence(ctx, position, alpha, beta, 1)
+            return -quiescence(ctx, position, -beta, -alpha, -1)
+        return evaluate_board(ctx.game, position)
     
+    # Table scores and windows are from the side to move's perspective; minimax scores are from the AI's,
+    # so they are negated with the player to move
+    table = ctx.table
+    sign = 1 if maximizing_player else -1
+    low, high = (alpha, beta) if maximizing_player else (-beta, -alpha)
+    # Probe the transposition table: an entry searched at least this deep can narrow or end the search
+    entry, cutoff, low, high = probe_window(table, position.key, depth, low, high)
+    if cutoff is not None:
+        return sign * cutoff
+    alpha, beta = (low, high) if maximizing_player else (-high, -low)
+    
+    # Generate all legal moves for the side to move
+    moves = generate_moves(position, "ai" if maximizing_player else "player")
+    # A side with no legal moves has lost; prefer the quickest win and the slowest loss
+    if not moves:
+        return -WIN_SCORE - depth if maximizing_player else WIN_SCORE + depth
+    # Try the stored best move first, then captures, killers and history-ranked quiet moves
+    if ctx.orderer is not None:
+        moves = ctx.orderer.order(moves, entry.move if entry is not None else None, ply)
+    
+    best_move = None
     # Maximizing player (AI's turn)
     if maximizing_player:
         # Initialize maximum evaluation to negative infinity
-        max_eval = -float('inf')
-        # Get all AI pieces (regular pieces = 2, kings = 4)
-        for row, col in [(r, c) for r in range(game.board_size) for c in range(game.board_size) if board[r][c] in (2, 4)]:
-            # Get valid moves for the current piece
-            moves = game.get_valid_moves_for_board(board, row, col)
-            # Iterate through all possible moves
-            for move_row, move_col in moves:
-                # Create a deep copy of the board to simulate the move
-                temp_board = deepcopy(board)
-                # Clear the original position
-                temp_board[row][col] = 0
-                # Move the piece to the new position
-                temp_board[move_row][move_col] = board[row][col]
-                # Check if the move is a capture (jump)
-                if abs(row - move_row) == 2:
-                    # Calculate the captured piece's position (midpoint)
-                    captured_row = (row + move_row) // 2
-                    captured_col = (col + move_col) // 2
-                    # Remove the captured piece
-                    temp_board[captured_row][captured_col] = 0
-                # Check if the piece should be promoted to a king
-                if temp_board[move_row][move_col] == 2 and move_row == 0:
-                    temp_board[move_row][move_col] = 4
-                # Recursively evaluate the move
-                eval_score = minimax(game, temp_board, depth - 1, alpha, beta, False)
-                # Update maximum evaluation
-                max_eval = max(max_eval, eval_score)
-                # Update alpha for pruning
-                alpha = max(alpha, eval_score)
-                # Alpha-beta pruning: stop evaluating if beta <= alpha
-                if beta <= alpha:
-                    break
-        # Return the maximum evaluation
-        return max_eval
+        best_eval = -float('inf')
+        # Iterate through all possible moves
+        for index, move in enumerate(moves):
+            # Play the move in place, evaluate it recursively, then restore the position
+            undo = make_move(position, move)
+            reduction = ctx.reduction(move, index, depth)
+            if reduction:
+                # Late quiet move: a reduced null-window search checks whether it can raise alpha at all
+                eval_score = minimax(ctx, position, depth - 1 - reduction, alpha, alpha + NULL_WINDOW, False, ply + 1)
+                if eval_score > alpha:
+                    eval_score = minimax(ctx, position, depth - 1, alpha, beta, False, ply + 1)
+            else:
+                eval_score = minimax(ctx, position, depth - 1, alpha, beta, False, ply + 1)
+            unmake_move(position, undo)
+            # Update maximum evaluation and the move that achieved it
+            if eval_score > best_eval:
+                best_eval = eval_score
+                best_move = move
+            # Update alpha for pruning
+            alpha = max(alpha, eval_score)
+            # Alpha-beta pruning: stop evaluating if beta <= alpha, crediting the refuting move
+            if beta <= alpha:
+                if ctx.orderer is not None:
+                    ctx.orderer.record_cutoff(move, depth, ply)
+                break
     # Minimizing player (opponent's turn)
     else:
         # Initialize minimum evaluation to positive infinity
-        min_eval = float('inf')
-        # Get all opponent pieces (regular pieces = 1, kings = 3)
-        for row, col in [(r, c) for r in range(game.board_size) for c in range(game.board_size) if board[r][c] in (1, 3)]:
-            # Get valid moves for the current piece
-            moves = game.get_valid_moves_for_board(board, row, col)
-            # Iterate through all possible moves
-            for move_row, move_col in moves:
-                # Create a deep copy of the board to simulate the move
-                temp_board = deepcopy(board)
-                # Clear the original position
-                temp_board[row][col] = 0
-                # Move the piece to the new position
-                temp_board[move_row][move_col] = board[row][col]
-                # Check if the move is a capture (jump)
-                if abs(row - move_row) == 2:
-                    # Calculate the captured piece's position (midpoint)
-                    captured_row = (row + move_row) // 2
-                    captured_col = (col + move_col) // 2
-                    # Remove the captured piece
-                    temp_board[captured_row][captured_col] = 0
-                # Check if the piece should be promoted to a king
-                if temp_board[move_row][move_col] == 1 and move_row == game.board_size - 1:
-                    temp_board[move_row][move_col] = 3
-                # Recursively evaluate the move
-                eval_score = minimax(game, temp_board, depth - 1, alpha, beta, True)
-                # Update minimum evaluation
-                min_eval = min(min_eval, eval_score)
-                # Update beta for pruning
-                beta = min(beta, eval_score)
-                # Alpha-beta pruning: stop evaluating if beta <= alpha
-                if beta <= alpha:
-                    break
-        # Return the minimum evaluation
-        return min_eval
\ No newline at end of file
+        best_eval = float('inf')
+        # Iterate through all possible moves
+        for index, move in enumerate(moves):
+            # Play the move in place, evaluate it recursively, then restore the position
+            undo = make_move(position, move)
+            reduction = ctx.reduction(move, index, depth)
+            if reduction:
+                # Late quiet move: a reduced null-window search checks whether it can lower beta at all
+                eval_score = minimax(ctx, position, depth - 1 - reduction, beta - NULL_WINDOW, beta, True, ply + 1)
+                if eval_score < beta:
+                    eval_score = minimax(ctx, position, depth - 1, alpha, beta, True, ply + 1)
+            else:
+                eval_score = minimax(ctx, position, depth - 1, alpha, beta, True, ply + 1)
+            unmake_move(position, undo)
+            # Update minimum evaluation and the move that achieved it
+            if eval_score < best_eval:
+                best_eval = eval_score
+                best_move = move
+            # Update beta for pruning
+            beta = min(beta, eval_score)
+            # Alpha-beta pruning: stop evaluating if beta <= alpha, crediting the refuting move
+            if beta <= alpha:
+                if ctx.orderer is not None:
+                    ctx.orderer.record_cutoff(move, depth, ply)
+                break
+    
+    # Store the result as exact or as the bound implied by the window actually searched (side to move's view)
+    store_result(table, position.key, depth, sign * best_eval, low, high, best_move)
+    # Return the best evaluation
+    return best_eval
@@ -0,0 +1,54 @@
+from bitboard import NUM_SQUARES
+
+# Deepest ply that keeps killer moves
+MAX_PLY = 128
+
+# Killer moves tried before other quiet moves, the first slot before the second
+KILLER_BONUS = (1 << 30, 1 << 29)
+
+class MoveOrderer:
+    """Orders moves for alpha-beta: hash move, then captures, then killers, then quiet moves by history.
+    
+    One orderer is used for a whole search (all iterations) by minimax and negamax alike.
+    """
+    
+    def __init__(self):
+        # Two killer moves per ply: quiet moves that caused a beta cutoff at that ply
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        # history[src][dst]: accumulated depth^2 of the cutoffs caused by the quiet move src -> dst
+        self.history = [[0] * NUM_SQUARES for _ in range(NUM_SQUARES)]
+    
+    def order(self, moves, hash_move, ply):
+        """Return ``moves`` in the order they should be searched at ``ply``."""
+        if len(moves) > 1:
+            if moves[0].captured:
+                # Captures are mandatory, so either every move captures or none does; longer chains first
+                moves = sorted(moves, key=lambda move: move.captured.bit_count(), reverse=True)
+            else:
+                killers = self.killers[ply]
+                history = self.history
+                
+                def quiet_score(move):
+                    if move == killers[0]:
+                        return KILLER_BONUS[0]
+                    if move == killers[1]:
+                        return KILLER_BONUS[1]
+                    return history[move.src][move.dst]
+                
+                moves = sorted(moves, key=quiet_score, reverse=True)
+        # The best move stored for this position (the previous iteration's PV move) is searched first
+        if hash_move is not None and moves[0] != hash_move and hash_move in moves:
+            moves = list(moves)
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+        return moves
+    
+    def record_cutoff(self, move, depth, ply):
+        """Credit a quiet move that caused a beta cutoff to the killer and history tables."""
+        if move.captured:
+            return
+        killers = self.killers[ply]
+        if move != killers[0]:
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[move.src][move.dst] += depth * depth
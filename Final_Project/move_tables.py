@@ -0,0 +1,30 @@
+from bitboard import BOARD_SIZE, NUM_SQUARES, ROW_OF, COL_OF, DIRECTIONS, square_of
+
+# Lookup tables indexed as TABLE[piece][square] for piece codes 0-4 (0 = empty, no moves).
+# Entries follow the direction order of CheckersLogic.get_directions.
+#   STEPS: squares a piece can step to
+#   JUMPS: (jumped-over square, landing square) pairs for captures
+
+def _on_board(row, col):
+    """Check if (row, col) lies on the board."""
+    return 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
+
+def _build_tables():
+    """Build the step and jump tables for every piece type and dark square."""
+    steps = [[()] * NUM_SQUARES for _ in range(5)]
+    jumps = [[()] * NUM_SQUARES for _ in range(5)]
+    for piece, directions in DIRECTIONS.items():
+        for sq in range(NUM_SQUARES):
+            row, col = ROW_OF[sq], COL_OF[sq]
+            piece_steps = []
+            piece_jumps = []
+            for dr, dc in directions:
+                if _on_board(row + dr, col + dc):
+                    piece_steps.append(square_of(row + dr, col + dc))
+                    if _on_board(row + 2 * dr, col + 2 * dc):
+                        piece_jumps.append((square_of(row + dr, col + dc), square_of(row + 2 * dr, col + 2 * dc)))
+            steps[piece][sq] = tuple(piece_steps)
+            jumps[piece][sq] = tuple(piece_jumps)
+    return steps, jumps
+
+STEPS, JUMPS = _build_tables()
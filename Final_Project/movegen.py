@@ -0,0 +1,101 @@
+from bitboard import Move, NUM_SQUARES, PLAYER_KING, PLAYER_PROMOTION_MASK, AI_PROMOTION_MASK
+from move_tables import STEPS, JUMPS
+
+# Longest path that fits a packed move: 4 bits of length and 5 bits per square in 64 bits (11 captures)
+MAX_PACKED_PATH = 12
+
+# Square jumped over by each capture hop, to rebuild a packed move's captured pieces from its path
+_JUMPED = {(src, land): over for src in range(NUM_SQUARES) for over, land in JUMPS[PLAYER_KING][src]}
+
+def generate_moves(position, side):
+    """Get every legal move for ``side`` in one pass.
+
+    Captures are mandatory: if any piece can jump, only capture moves are
+    returned, each one a complete multi-jump chain. Otherwise every step of
+    every piece is returned. Pieces come from the position's incrementally
+    maintained piece set, so enumeration is O(pieces).
+    """
+    if side == "ai":
+        opponent, promotion_mask = position.black, AI_PROMOTION_MASK
+    else:
+        opponent, promotion_mask = position.white, PLAYER_PROMOTION_MASK
+    empty = ~(position.black | position.white)
+    kings = position.kings
+    # Piece codes are 1/2 for men and 3/4 for kings, matching the NumPy board
+    man = 2 if side == "ai" else 1
+    pieces = position.piece_squares[side]
+    
+    captures = []
+    for sq in pieces:
+        piece = man + 2 if kings >> sq & 1 else man
+        for over, land in JUMPS[piece][sq]:
+            if opponent >> over & 1 and empty >> land & 1:
+                # The moving piece leaves its square, so a king's chain may pass back over it
+                _extend_captures(piece, sq, sq, opponent, empty | (1 << sq), 0, (sq,), promotion_mask, captures)
+                break
+    if captures:
+        return captures
+    
+    moves = []
+    for sq in pieces:
+        piece = man + 2 if kings >> sq & 1 else man
+        for dst in STEPS[piece][sq]:
+            if empty >> dst & 1:
+                moves.append(Move(sq, dst, 0, (sq, dst)))
+    return moves
+
+def _extend_captures(piece, src, sq, opponent, empty, captured, path, promotion_mask, out):
+    """Depth-first search over capture chains from ``sq``, appending each complete chain to ``out``."""
+    for over, land in JUMPS[piece][sq]:
+        over_bit = 1 << over
+        if opponent & over_bit and empty >> land & 1:
+            chain = path + (land,)
+            # Captured pieces come off the board immediately, as in CheckersLogic.make_move
+            if piece <= 2 and (1 << land) & promotion_mask:
+                # A man that reaches the far row is crowned and the move ends
+                out.append(Move(src, land, captured | over_bit, chain))
+            else:
+                before = len(out)
+                _extend_captures(piece, src, land, opponent & ~over_bit, empty | over_bit,
+                                 captured | over_bit, chain, promotion_mask, out)
+                if len(out) == before:
+                    out.append(Move(src, land, captured | over_bit, chain))
+
+def has_moves(position, side):
+    """Check whether any piece of ``side`` has a move."""
+    opponent = position.black if side == "ai" else position.white
+    empty = ~(position.black | position.white)
+    man = 2 if side == "ai" else 1
+    for sq in position.piece_squares[side]:
+        piece = man + 2 if position.kings >> sq & 1 else man
+        if any(empty >> dst & 1 for dst in STEPS[piece][sq]):
+            return True
+        if any(opponent >> over & 1 and empty >> land & 1 for over, land in JUMPS[piece][sq]):
+            return True
+    return False
+
+def pack_move(move):
+    """Pack ``move`` into a 64-bit integer: the path length, then 5 bits per path square.
+
+    ``None`` packs to 0. A path longer than MAX_PACKED_PATH squares raises ValueError.
+    """
+    if move is None:
+        return 0
+    if len(move.path) > MAX_PACKED_PATH:
+        raise ValueError(f"Move path of {len(move.path)} squares is too long to pack")
+    word = len(move.path)
+    for index, sq in enumerate(move.path):
+        word |= sq << (4 + 5 * index)
+    return word
+
+def unpack_move(word):
+    """Rebuild the move packed by pack_move, or None for 0."""
+    if not word:
+        return None
+    path = tuple((word >> (4 + 5 * index)) & 31 for index in range(word & 15))
+    captured = 0
+    for src, dst in zip(path, path[1:]):
+        over = _JUMPED.get((src, dst))
+        if over is not None:
+            captured |= 1 << over
+    return Move(path[0], path[-1], captured, path)
\ No newline at end of file
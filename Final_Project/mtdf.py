@@ -0,0 +1,55 @@
+from bitboard import Position
+from negamax import negamax_child
+from search import SearchContext, iterative_deepening, search_root, MAX_DEPTH, NULL_WINDOW
+from transposition import LOWER
+from utils import evaluate_board
+
+def mtdf_move(game, time_limit_ms=None):
+    """MTD(f) algorithm for AI move."""
+    return mtdf_search(game, time_limit_ms).move
+
+def mtdf_search(game, time_limit_ms=None):
+    """Search the game position with MTD(f) and return a SearchResult.
+
+    MTD(f) needs a good first guess, so even without a time limit it deepens
+    1, 2, ... up to ``game.ai_difficulty``, each iteration starting from the
+    previous score. With a time limit (argument or ``game.ai_time_limit_ms``) it
+    deepens until the budget in milliseconds runs out.
+    """
+    if time_limit_ms is None:
+        time_limit_ms = game.ai_time_limit_ms
+    ctx = SearchContext(game, lmr=game.ai_lmr)
+    # Age the previous move's entries and reset the table statistics
+    ctx.table.new_search()
+    if time_limit_ms is None:
+        result = iterative_deepening(ctx, mtdf_root, game.ai_difficulty)
+    else:
+        result = iterative_deepening(ctx, mtdf_root, MAX_DEPTH, time_limit_ms)
+    game.last_search = result
+    return result
+
+def mtdf_root(ctx, depth):
+    """Converge on the root score with null-window searches, starting from the previous iteration's score."""
+    guess = ctx.previous_score
+    # First iteration: start from the static evaluation of the root
+    if guess is None:
+        guess = evaluate_board(ctx.game, ctx.game.board)
+    lower, upper = -float('inf'), float('inf')
+    best = None
+    while lower + NULL_WINDOW <= upper:
+        # Test whether the score reaches beta; each search moves one bound to the returned score
+        beta = max(guess, lower + NULL_WINDOW)
+        root = search_root(ctx, depth, negamax_child, beta - NULL_WINDOW, beta)
+        # No legal moves: there is nothing to converge on
+        if root.move is None:
+            return root
+        guess = root.score
+        if guess < beta:
+            upper = guess
+        else:
+            lower = guess
+            # A fail high proves its move reaches the lower bound
+            best = root
+    # The last search may have failed low; keep the proven move first for the next iteration
+    ctx.table.store(Position.from_board(ctx.game.board, "ai").key, depth, best.score, LOWER, best.move)
+    return best
\ No newline at end of file
@@ -1,92 +1,108 @@
-from copy import deepcopy
-from utils import evaluate_board, is_terminal
+from bitboard import make_move, unmake_move
+from movegen import generate_moves
+from parallel import parallel_root
+from smp import lazy_smp
+from search import SearchContext, iterative_deepening, search_root, quiescence, MAX_DEPTH, NULL_WINDOW
+from transposition import probe_window, store_result
+from utils import evaluate_board, WIN_SCORE
 
-def negamax_move(game):
+def negamax_move(game, time_limit_ms=None):
     """Negamax algorithm for AI move."""
-    # Initialize best score to negative infinity and best move to None
-    best_score = -float('inf')
-    best_move = None
-    # Get all AI pieces (regular pieces = 2, kings = 4)
-    ai_pieces = [(r, c) for r in range(game.board_size) for c in range(game.board_size) if game.board[r][c] in (2, 4)]
+    return negamax_search(game, time_limit_ms).move
+
+def negamax_search(game, time_limit_ms=None):
+    """Search the game position with negamax and return a SearchResult.
     
-    # Iterate through all AI pieces
-    for row, col in ai_pieces:
-        # Get valid moves for the current piece
-        moves = game.get_valid_moves(row, col)
-        # Iterate through all possible moves for the current piece
-        for move_row, move_col in moves:
-            # Create a deep copy of the board to simulate the move
-            temp_board = deepcopy(game.board)
-            # Clear the original position
-            temp_board[row][col] = 0
-            # Move the piece to the new position
-            temp_board[move_row][move_col] = game.board[row][col]
-            # Check if the move is a capture (jump)
-            if abs(row - move_row) == 2:
-                # Calculate the captured piece's position (midpoint)
-                captured_row = (row + move_row) // 2
-                captured_col = (col + move_col) // 2
-                # Remove the captured piece
-                temp_board[captured_row][captured_col] = 0
-            # Check if the piece should be promoted to a king
-            if temp_board[move_row][move_col] == 2 and move_row == 0:
-                temp_board[move_row][move_col] = 4
-            # Evaluate the move using negamax with reduced depth and opponent perspective
-            score = -negamax(game, temp_board, game.ai_difficulty - 1, -float('inf'), float('inf'), -1)
-            # Update best score and move if this move is better
-            if score > best_score:
-                best_score = score
-                best_move = (row, col, move_row, move_col)
+    Without a time limit the search runs to depth ``game.ai_difficulty``. With one
+    (argument or ``game.ai_time_limit_ms``) it deepens 1, 2, 3, ... until the budget
+    in milliseconds runs out and reports the deepest completed iteration. With
+    ``game.ai_workers`` > 1 it searches root moves in parallel, or with Lazy SMP
+    when ``game.ai_parallel`` is "smp".
+    """
+    if time_limit_ms is None:
+        time_limit_ms = game.ai_time_limit_ms
+    # Lazy SMP: this process searches alone while helper processes fill the shared transposition table
+    lazy = game.ai_parallel == "smp" and game.ai_workers > 1
+    ctx = SearchContext(game, lmr=game.ai_lmr, workers=1 if lazy else game.ai_workers)
+    # Age the previous move's entries and reset the table statistics
+    ctx.table.new_search()
+    deepen = lazy_smp if lazy else iterative_deepening
+    if time_limit_ms is None:
+        result = deepen(ctx, negamax_root, game.ai_difficulty, start_depth=game.ai_difficulty)
+    else:
+        result = deepen(ctx, negamax_root, MAX_DEPTH, time_limit_ms)
+    game.last_search = result
+    return result
+
+def negamax_root(ctx, depth):
+    """Search every AI move to ``depth`` and return a RootResult.
     
-    # Return the best move found
-    return best_move
+    With ``ctx.workers`` > 1 the root moves are searched over a thread or process pool.
+    """
+    if ctx.workers > 1:
+        return parallel_root(ctx, depth, negamax_child)
+    return search_root(ctx, depth, negamax_child)
+
+def negamax_child(ctx, position, depth, alpha, beta):
+    """Score the position after an AI root move (the player to move) from the AI's perspective."""
+    return -negamax(ctx, position, depth, -beta, -alpha, -1)
 
-def negamax(game, board, depth, alpha, beta, color):
-    """Negamax with alpha-beta pruning."""
-    # Base case: if depth is 0 or the board is in a terminal state, return evaluation adjusted by color
-    if depth == 0 or is_terminal(game, board):
-        return color * evaluate_board(game, board)
+def negamax(ctx, position, depth, alpha, beta, color, ply=1):
+    """Negamax with alpha-beta pruning and a transposition table."""
+    # Count the node; this raises SearchTimeout once the time budget is spent
+    ctx.count_node()
+    # Base case: if depth is 0, resolve pending captures or return evaluation adjusted by color
+    if depth == 0:
+        if ctx.quiescence:
+            return quiescence(ctx, position, alpha, beta, color)
+        return color * evaluate_board(ctx.game, position)
+    
+    # Probe the transposition table: an entry searched at least this deep can narrow or end the search
+    table = ctx.table
+    entry, cutoff, alpha, beta = probe_window(table, position.key, depth, alpha, beta)
+    if cutoff is not None:
+        return cutoff
+    # Window actually searched, used to classify the result as exact or a bound
+    alpha_orig, beta_orig = alpha, beta
+    
+    # Generate all legal moves of the current player (AI: color 1; opponent: color -1)
+    moves = generate_moves(position, "ai" if color == 1 else "player")
+    # A side with no legal moves has lost; prefer the quickest win and the slowest loss
+    if not moves:
+        return -WIN_SCORE - depth
+    # Try the stored best move first, then captures, killers and history-ranked quiet moves
+    if ctx.orderer is not None:
+        moves = ctx.orderer.order(moves, entry.move if entry is not None else None, ply)
     
     # Initialize maximum score to negative infinity
     max_score = -float('inf')
-    # Select piece types based on player (AI: 2, 4; opponent: 1, 3)
-    piece_types = (2, 4) if color == 1 else (1, 3)
-    # Get all pieces of the current player
-    pieces = [(r, c) for r in range(game.board_size) for c in range(game.board_size) if board[r][c] in piece_types]
+    best_move = None
+    # Iterate through all possible moves
+    for index, move in enumerate(moves):
+        # Play the move in place, evaluate it from the opponent's perspective, then restore the position
+        undo = make_move(position, move)
+        reduction = ctx.reduction(move, index, depth)
+        if reduction:
+            # Late quiet move: a reduced null-window search checks whether it can beat alpha at all
+            score = -negamax(ctx, position, depth - 1 - reduction, -alpha - NULL_WINDOW, -alpha, -color, ply + 1)
+            if score > alpha:
+                score = -negamax(ctx, position, depth - 1, -beta, -alpha, -color, ply + 1)
+        else:
+            score = -negamax(ctx, position, depth - 1, -beta, -alpha, -color, ply + 1)
+        unmake_move(position, undo)
+        # Update maximum score and the move that achieved it
+        if score > max_score:
+            max_score = score
+            best_move = move
+        # Update alpha for pruning
+        alpha = max(alpha, score)
+        # Alpha-beta pruning: stop evaluating if alpha >= beta, crediting the refuting move
+        if alpha >= beta:
+            if ctx.orderer is not None:
+                ctx.orderer.record_cutoff(move, depth, ply)
+            break
     
-    # Iterate through all pieces
-    for row, col in pieces:
-        # Get valid moves for the current piece
-        moves = game.get_valid_moves_for_board(board, row, col)
-        # Iterate through all possible moves
-        for move_row, move_col in moves:
-            # Create a deep copy of the board to simulate the move
-            temp_board = deepcopy(board)
-            # Clear the original position
-            temp_board[row][col] = 0
-            # Move the piece to the new position
-            temp_board[move_row][move_col] = board[row][col]
-            # Check if the move is a capture (jump)
-            if abs(row - move_row) == 2:
-                # Calculate the captured piece's position (midpoint)
-                captured_row = (row + move_row) // 2
-                captured_col = (col + move_col) // 2
-                # Remove the captured piece
-                temp_board[captured_row][captured_col] = 0
-            # Check if AI piece should be promoted to a king
-            if temp_board[move_row][move_col] == 2 and move_row == 0:
-                temp_board[move_row][move_col] = 4
-            # Check if opponent piece should be promoted to a king
-            elif temp_board[move_row][move_col] == 1 and move_row == game.board_size - 1:
-                temp_board[move_row][move_col] = 3
-            # Recursively evaluate the move from the opponent's perspective
-            score = -negamax(game, temp_board, depth - 1, -beta, -alpha, -color)
-            # Update maximum score
-            max_score = max(max_score, score)
-            # Update alpha for pruning
-            alpha = max(alpha, score)
-            # Alpha-beta pruning: stop evaluating if alpha >= beta
-            if alpha >= beta:
-                break
+    # Store the result as exact or as the bound implied by the search window
+    store_result(table, position.key, depth, max_score, alpha_orig, beta_orig, best_move)
     # Return the maximum score
-    return max_score
\ No newline at end of file
+    return max_score
@@ -0,0 +1,120 @@
+import multiprocessing
+import threading
+from concurrent.futures import as_completed
+from bitboard import Position, make_move, unmake_move
+from executors import make_executor, uses_threads
+from movegen import generate_moves
+from search import SearchContext, RootResult, NULL_WINDOW, principal_variation
+from transposition import EXACT
+
+# Scores this close to the best are re-searched exactly when they are only an upper bound
+TIE_EPSILON = 1e-9
+
+# Pools by (worker count, threads), each with the shared best-score bound its workers read
+_pools = {}
+
+# Per-worker state: the shared bound, a game holding the worker's table, and the last search id.
+# Thread-local so thread workers keep separate tables; a process worker runs its tasks on one thread
+_worker = threading.local()
+
+def _init_worker(shared_alpha):
+    """Set up a pool worker: remember the shared bound and create the worker's own transposition table."""
+    # Imported here because game_logic imports the engines that import this module
+    from game_logic import CheckersLogic
+    _worker.alpha = shared_alpha
+    _worker.game = CheckersLogic(0, "minimax")
+    _worker.search_id = None
+
+def get_pool(workers, backend="auto"):
+    """Return the pool and shared bound for ``workers`` workers of ``backend``, starting them on first use."""
+    threads = uses_threads(backend)
+    if (workers, threads) not in _pools:
+        shared_alpha = multiprocessing.Value('d', -float('inf'))
+        pool = make_executor(workers, threads, _init_worker, (shared_alpha,))
+        _pools[workers, threads] = (pool, shared_alpha)
+    return _pools[workers, threads]
+
+def _search_move(board, move, depth, alpha, beta, child_search, options):
+    """Pool task: score one root move to ``depth`` and return (score, exact, nodes).
+    
+    The move is first tested with a null window at the best score known to any
+    worker, then re-searched with the full window if it beats it.
+    """
+    search_id, deadline, ordering, quiescence = options
+    game = _worker.game
+    # A new search starts from an empty table, as the sequential search would for these subtrees
+    if _worker.search_id != search_id:
+        game.transposition_table.clear()
+        game.transposition_table.new_search()
+        _worker.search_id = search_id
+    ctx = SearchContext(game, ordering=ordering, quiescence=quiescence, lmr=None)
+    ctx.deadline = deadline
+    alpha = max(alpha, _worker.alpha.value)
+    position = Position.from_board(board, "ai")
+    make_move(position, move)
+    score = child_search(ctx, position, depth - 1, alpha, alpha + NULL_WINDOW)
+    if alpha < score < beta:
+        score = child_search(ctx, position, depth - 1, alpha, beta)
+    # Fail-soft scores above the bound are exact; the rest are upper bounds
+    return score, score > alpha, ctx.nodes
+
+def parallel_root(ctx, depth, child_search):
+    """Search every AI move to ``depth`` over a thread or process pool and return a RootResult.
+    
+    Young brothers wait: the first move is searched here to set the bound, then the
+    remaining moves are searched in parallel, each starting from the best score found
+    so far by any worker. The best move and score match ``search_root`` without late
+    move reductions: the earliest move with the highest exact score.
+    """
+    position = Position.from_board(ctx.game.board, "ai")
+    moves = generate_moves(position, "ai")
+    if ctx.orderer is not None:
+        entry = ctx.table.probe(position.key)
+        moves = ctx.orderer.order(moves, entry.move if entry is not None else None, 0)
+    if not moves:
+        return RootResult(None, -float('inf'), [], [])
+    
+    # Eldest brother: searched alone with the full window
+    undo = make_move(position, moves[0])
+    first_score = child_search(ctx, position, depth - 1, -float('inf'), float('inf'))
+    unmake_move(position, undo)
+    # Per move: score and whether it is exact (True) or an upper bound from a failed null-window test
+    results = [(first_score, True)] + [None] * (len(moves) - 1)
+    best_score = first_score
+    
+    pool, shared_alpha = get_pool(ctx.workers, ctx.game.ai_backend)
+    shared_alpha.value = best_score
+    options = (ctx.search_id, ctx.deadline, ctx.orderer is not None, ctx.quiescence)
+    futures = {pool.submit(_search_move, ctx.game.board, move, depth, best_score, float('inf'), child_search, options):
+               index for index, move in enumerate(moves) if index > 0}
+    try:
+        for future in as_completed(futures):
+            index = futures[future]
+            score, exact, nodes = future.result()
+            ctx.nodes += nodes
+            results[index] = (score, exact)
+            if score > best_score:
+                best_score = score
+                shared_alpha.value = best_score
+    finally:
+        # On a timeout, drop the moves no worker has started
+        for future in futures:
+            future.cancel()
+    
+    # A move whose upper bound reaches the best score may tie it: settle it with an exact search
+    for index, (score, exact) in enumerate(results):
+        if not exact and score >= best_score - TIE_EPSILON:
+            undo = make_move(position, moves[index])
+            results[index] = (child_search(ctx, position, depth - 1, -float('inf'), float('inf')), True)
+            unmake_move(position, undo)
+    # Same choice as the sequential root: the first move with the highest score
+    best_move = None
+    best_score = -float('inf')
+    for move, (score, exact) in zip(moves, results):
+        if score > best_score:
+            best_score = score
+            best_move = move
+    
+    ctx.table.store(position.key, depth, best_score, EXACT, best_move)
+    root_scores = [(move, score) for move, (score, exact) in zip(moves, results)]
+    return RootResult(best_move, best_score, principal_variation(ctx, position, best_move, depth), root_scores)
\ No newline at end of file
@@ -0,0 +1,123 @@
+from bitboard import make_move, unmake_move
+from movegen import generate_moves
+from search import SearchContext, iterative_deepening, search_root, quiescence, MAX_DEPTH, NULL_WINDOW
+from transposition import probe_window, store_result
+from utils import evaluate_board, WIN_SCORE
+
+# Half-width of the first aspiration window around the previous iteration's score (a man is worth 1)
+ASPIRATION_WINDOW = 0.25
+# Once a widened window exceeds this half-width the root is searched with an infinite window
+ASPIRATION_LIMIT = 4
+
+def pvs_move(game, time_limit_ms=None):
+    """Principal variation search for AI move."""
+    return pvs_search(game, time_limit_ms).move
+
+def pvs_search(game, time_limit_ms=None):
+    """Search the game position with principal variation search and return a SearchResult.
+    
+    Aspiration windows need the previous iteration's score, so even without a time
+    limit it deepens 1, 2, ... up to ``game.ai_difficulty``. With a time limit
+    (argument or ``game.ai_time_limit_ms``) it deepens until the budget in
+    milliseconds runs out. Every iteration after the first starts from an
+    aspiration window around the previous iteration's score.
+    """
+    if time_limit_ms is None:
+        time_limit_ms = game.ai_time_limit_ms
+    ctx = SearchContext(game, lmr=game.ai_lmr)
+    # Age the previous move's entries and reset the table statistics
+    ctx.table.new_search()
+    if time_limit_ms is None:
+        result = iterative_deepening(ctx, pvs_root, game.ai_difficulty)
+    else:
+        result = iterative_deepening(ctx, pvs_root, MAX_DEPTH, time_limit_ms)
+    game.last_search = result
+    return result
+
+def pvs_root(ctx, depth):
+    """Search the root inside an aspiration window around the previous score, widening it on failure."""
+    previous = ctx.previous_score
+    # No previous iteration, or a won/lost score: search with an infinite window
+    if previous is None or abs(previous) >= WIN_SCORE:
+        return search_root(ctx, depth, pvs_child)
+    
+    delta = ASPIRATION_WINDOW
+    alpha, beta = previous - delta, previous + delta
+    while True:
+        root = search_root(ctx, depth, pvs_child, alpha, beta)
+        # Inside the window the score is exact; without legal moves there is nothing to widen
+        if alpha < root.score < beta or root.move is None:
+            return root
+        # Fail low or fail high: widen the failing side and search again
+        delta *= 4
+        if delta > ASPIRATION_LIMIT:
+            alpha, beta = -float('inf'), float('inf')
+        elif root.score <= alpha:
+            alpha = root.score - delta
+        else:
+            beta = root.score + delta
+
+def pvs_child(ctx, position, depth, alpha, beta):
+    """Score the position after an AI root move (the player to move) from the AI's perspective."""
+    return -pvs(ctx, position, depth, -beta, -alpha, -1)
+
+def pvs(ctx, position, depth, alpha, beta, color, ply=1):
+    """Principal variation search: negamax that tests all but the first move with a null window."""
+    # Count the node; this raises SearchTimeout once the time budget is spent
+    ctx.count_node()
+    # Base case: if depth is 0, resolve pending captures or return evaluation adjusted by color
+    if depth == 0:
+        if ctx.quiescence:
+            return quiescence(ctx, position, alpha, beta, color)
+        return color * evaluate_board(ctx.game, position)
+    
+    # Probe the transposition table: an entry searched at least this deep can narrow or end the search
+    table = ctx.table
+    entry, cutoff, alpha, beta = probe_window(table, position.key, depth, alpha, beta)
+    if cutoff is not None:
+        return cutoff
+    # Window actually searched, used to classify the result as exact or a bound
+    alpha_orig, beta_orig = alpha, beta
+    
+    # Generate all legal moves of the current player (AI: color 1; opponent: color -1)
+    moves = generate_moves(position, "ai" if color == 1 else "player")
+    # A side with no legal moves has lost; prefer the quickest win and the slowest loss
+    if not moves:
+        return -WIN_SCORE - depth
+    # Try the stored best move first, then captures, killers and history-ranked quiet moves
+    if ctx.orderer is not None:
+        moves = ctx.orderer.order(moves, entry.move if entry is not None else None, ply)
+    
+    max_score = -float('inf')
+    best_move = None
+    for index, move in enumerate(moves):
+        undo = make_move(position, move)
+        if index == 0:
+            # The expected principal variation move gets the full window
+            score = -pvs(ctx, position, depth - 1, -beta, -alpha, -color, ply + 1)
+        else:
+            # Null-window test: can this move beat alpha? Late quiet moves are tested at reduced depth first
+            reduction = ctx.reduction(move, index, depth)
+            score = -pvs(ctx, position, depth - 1 - reduction, -alpha - NULL_WINDOW, -alpha, -color, ply + 1)
+            if reduction and score > alpha:
+                score = -pvs(ctx, position, depth - 1, -alpha - NULL_WINDOW, -alpha, -color, ply + 1)
+            if alpha < score < beta:
+                # Fail high inside the window: re-search with the full window for the exact score
+                score = -pvs(ctx, position, depth - 1, -beta, -alpha, -color, ply + 1)
+        unmake_move(position, undo)
+        # Update maximum score and the move that achieved it
+        if score > max_score:
+            max_score = score
+            best_move = move
+        # Update alpha for pruning
+        alpha = max(alpha, score)
+        # Beta cutoff, crediting the refuting move
+        if alpha >= beta:
+            if ctx.orderer is not None:
+                ctx.orderer.record_cutoff(move, depth, ply)
+            break
+    
+    # Store the result as exact or as the bound implied by the search window
+    store_result(table, position.key, depth, max_score, alpha_orig, beta_orig, best_move)
+    # Return the maximum score
+    return max_score
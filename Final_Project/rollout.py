@@ -0,0 +1,148 @@
+import numpy as np
+from bitboard import (BOARD_SIZE, NUM_SQUARES, ROW_OF, COL_OF, CENTER_MASK, PLAYER_PROMOTION_MASK,
+                      AI_PROMOTION_MASK, square_of)
+
+# Batched random playouts: N positions advance in lock-step, one capture hop or step per board per round,
+# with every board's bitboards held in NumPy arrays so each round is a handful of array operations.
+
+FULL = np.uint64((1 << NUM_SQUARES) - 1)
+ONE = np.uint64(1)
+# Bit positions 0-31, for unpacking bitboards into per-square flags
+BIT_SHIFTS = np.arange(NUM_SQUARES, dtype=np.uint64)
+
+# Diagonal directions as (row, col) steps; the AI's men move along the first two, the player's along the last two
+DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+def _build_direction_tables():
+    """Return the shift tables and source squares of a one-square step in each direction.
+    
+    A step moves a square index by one of two amounts depending on the row parity,
+    so each direction has two (source mask, shift) groups, stored as left and right
+    shift amounts so all directions shift together. SOURCES[d][sq] is the square a
+    step in direction d lands on sq from, or -1.
+    """
+    masks = np.zeros((len(DIRECTIONS), 2), dtype=np.uint64)
+    left = np.zeros((len(DIRECTIONS), 2), dtype=np.uint64)
+    right = np.zeros((len(DIRECTIONS), 2), dtype=np.uint64)
+    sources = np.full((len(DIRECTIONS), NUM_SQUARES), -1, dtype=np.int64)
+    for d, (dr, dc) in enumerate(DIRECTIONS):
+        groups = {}
+        for sq in range(NUM_SQUARES):
+            row, col = ROW_OF[sq] + dr, COL_OF[sq] + dc
+            if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+                dst = square_of(row, col)
+                groups[dst - sq] = groups.get(dst - sq, 0) | (1 << sq)
+                sources[d, dst] = sq
+        for group, (shift, mask) in enumerate(sorted(groups.items())):
+            masks[d, group] = mask
+            left[d, group] = max(shift, 0)
+            right[d, group] = max(-shift, 0)
+    return masks, left, right, sources
+
+STEP_MASKS, STEP_LEFT, STEP_RIGHT, SOURCES = _build_direction_tables()
+
+def _evaluation_weights():
+    """Return per-square values of AI men, AI kings, player men and player kings, matching evaluate_position."""
+    center = np.array([0.2 if CENTER_MASK >> sq & 1 else 0.0 for sq in range(NUM_SQUARES)])
+    rows = np.array(ROW_OF, dtype=np.float64)
+    return (1 + rows * 0.1 + center, 1.5 + center, 1 + (BOARD_SIZE - 1 - rows) * 0.1 + center, 1.5 + center)
+
+AI_MAN_VALUE, AI_KING_VALUE, PLAYER_MAN_VALUE, PLAYER_KING_VALUE = _evaluation_weights()
+
+def _step(bb):
+    """Shift bitboards of shape (N, 4) one square along each column's direction; bits leaving the board vanish."""
+    moved = (bb[:, :, None] & STEP_MASKS) << STEP_LEFT >> STEP_RIGHT
+    return moved[:, :, 0] | moved[:, :, 1]
+
+def _unpack(bb):
+    """Return the bitboards ``bb`` of shape (..., ) as 0/1 flags of shape (..., 32)."""
+    return (bb[..., None] >> BIT_SHIFTS) & ONE
+
+def evaluate_batch(black, white, kings):
+    """Evaluate many bitboard positions at once from the AI's perspective, as evaluate_position does."""
+    black_kings = _unpack(black & kings)
+    white_kings = _unpack(white & kings)
+    ai_score = _unpack(white & ~kings) @ AI_MAN_VALUE + white_kings @ AI_KING_VALUE
+    player_score = _unpack(black & ~kings) @ PLAYER_MAN_VALUE + black_kings @ PLAYER_KING_VALUE
+    return ai_score - player_score
+
+def batch_rollouts(positions, rng, max_steps=50):
+    """Play a random game from each of ``positions`` together and return their rewards for the AI.
+    
+    Follows MCTS's single rollout: the side to move without legal moves loses (-1 for
+    the AI, 1 for the player), and a game still running after ``max_steps`` moves
+    scores evaluate_position / 10. Captures are mandatory and a capture chain is
+    chosen one hop at a time, continuing with the same piece until it can no longer
+    jump or is crowned. ``rng`` is a numpy.random.Generator.
+    """
+    rewards = np.zeros(len(positions))
+    # Games still running: their index in ``positions`` and their state, compacted as games end
+    games = np.arange(len(positions))
+    black = np.array([position.black for position in positions], dtype=np.uint64)
+    white = np.array([position.white for position in positions], dtype=np.uint64)
+    kings = np.array([position.kings for position in positions], dtype=np.uint64)
+    ai_to_move = np.array([position.side == "ai" for position in positions], dtype=bool)
+    # Moves completed per game, and the bit of a piece in the middle of a capture chain (0 when none)
+    moves = np.zeros(len(positions), dtype=np.int64)
+    chain = np.zeros(len(positions), dtype=np.uint64)
+    
+    while len(games):
+        own = np.where(ai_to_move, white, black)
+        opponent = np.where(ai_to_move, black, white)
+        empty = ~(black | white) & FULL
+        in_chain = chain != 0
+        # Pieces that may move in each direction: men only forwards, and only the chain's piece mid-chain
+        forward = np.stack([ai_to_move, ai_to_move, ~ai_to_move, ~ai_to_move], axis=1)
+        movers = np.where(forward, own[:, None], (own & kings)[:, None])
+        movers = np.where(in_chain[:, None], movers & chain[:, None], movers)
+        # Landing squares of every step and jump, per direction
+        ahead = _step(movers)
+        steps = ahead & empty[:, None]
+        jumps = _step(ahead & opponent[:, None]) & empty[:, None]
+        can_jump = jumps.any(axis=1)
+        candidates = np.where(can_jump[:, None], jumps, steps)
+        
+        # A chain with no further jump ends the turn; without a chain or a move, the side to move has lost
+        finished = in_chain & ~can_jump
+        lost = ~in_chain & ~candidates.any(axis=1)
+        moving = ~finished & ~lost
+        
+        # Pick one move uniformly per game: the pick-th of its candidate flags, counted direction by direction
+        # (games without a move pick past the end, clamped to a move that is then ignored)
+        rows = np.arange(len(games))
+        counts = np.bitwise_count(candidates).astype(np.int64)
+        cumulative = counts.cumsum(axis=1)
+        pick = (rng.random(len(games)) * cumulative[:, -1]).astype(np.int64)
+        direction = np.minimum((cumulative <= pick[:, None]).sum(axis=1), len(DIRECTIONS) - 1)
+        pick -= cumulative[rows, direction] - counts[rows, direction]
+        squares = _unpack(candidates[rows, direction]).cumsum(axis=1)
+        dst = np.minimum((squares <= pick[:, None]).sum(axis=1), NUM_SQUARES - 1)
+        over = SOURCES[direction, dst]
+        src = np.where(can_jump, SOURCES[direction, over], over)
+        
+        # Play the chosen moves; games not moving this round get empty bitboards, which change nothing
+        none = np.uint64(0)
+        src_bit = np.where(moving, ONE << src.astype(np.uint64), none)
+        dst_bit = np.where(moving, ONE << dst.astype(np.uint64), none)
+        over_bit = np.where(moving & can_jump, ONE << over.astype(np.uint64), none)
+        king = (kings & src_bit) != 0
+        white = np.where(ai_to_move, white & ~src_bit | dst_bit, white & ~over_bit)
+        black = np.where(ai_to_move, black & ~over_bit, black & ~src_bit | dst_bit)
+        promotion = np.where(ai_to_move, np.uint64(AI_PROMOTION_MASK), np.uint64(PLAYER_PROMOTION_MASK))
+        crowned = ~king & ((dst_bit & promotion) != 0)
+        kings = kings & ~src_bit & ~over_bit | np.where(king | crowned, dst_bit, none)
+        # A jump continues the chain unless the man was just crowned; any other move completes the turn
+        continuing = moving & can_jump & ~crowned
+        chain = np.where(continuing, dst_bit, none)
+        finished |= moving & ~continuing
+        ai_to_move = ai_to_move ^ finished
+        moves += finished
+        
+        # Score the games that ended: lost, or still running after max_steps moves
+        rewards[games[lost]] = np.where(ai_to_move[lost], -1.0, 1.0)
+        expired = finished & (moves >= max_steps)
+        rewards[games[expired]] = evaluate_batch(black[expired], white[expired], kings[expired]) / 10
+        running = ~lost & ~expired
+        games, black, white, kings = games[running], black[running], white[running], kings[running]
+        ai_to_move, moves, chain = ai_to_move[running], moves[running], chain[running]
+    return rewards
@@ -0,0 +1,204 @@
+import itertools
+import time
+from collections import namedtuple
+from bitboard import Position, make_move, unmake_move
+from movegen import generate_moves
+from move_ordering import MoveOrderer
+from transposition import store_result
+from utils import evaluate_board, WIN_SCORE
+
+# Deepest iteration a time-bounded search will attempt
+MAX_DEPTH = 64
+
+# Width of the null window used to test whether a root move beats the current best score
+NULL_WINDOW = 1e-6
+
+# Outcome of one root iteration: best move, its score, the principal variation and (move, score) per root move
+RootResult = namedtuple("RootResult", ["move", "score", "pv", "root_scores"])
+# Outcome of a whole search: the RootResult fields of the deepest completed iteration plus search statistics
+SearchResult = namedtuple("SearchResult", ["move", "score", "depth", "nodes", "time", "pv", "root_scores"])
+
+# Late move reductions: at nodes with at least ``min_depth`` plies left, quiet moves after the first
+# ``full_moves`` (at least 1) are searched ``reduction`` plies shallower and re-searched at full depth if they beat alpha
+LateMoveReductions = namedtuple("LateMoveReductions", ["min_depth", "full_moves", "reduction"])
+DEFAULT_LMR = LateMoveReductions(min_depth=3, full_moves=3, reduction=1)
+
+# Source of SearchContext.search_id
+_search_ids = itertools.count()
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time budget has run out."""
+
+class SearchContext:
+    """State shared by every node of one search: the game, the transposition table, the clock and counters."""
+    
+    # Nodes between clock checks; a power of two so the check is a mask test
+    CHECK_INTERVAL = 256
+    
+    def __init__(self, game, ordering=True, pvs_root=True, quiescence=True, lmr=DEFAULT_LMR, workers=1, table=None,
+                 stop=None):
+        self.game = game
+        # Threads or processes searching root moves in parallel; 1 searches them one after another in this process
+        self.workers = workers
+        # LateMoveReductions settings, or None to search every move to full depth. Reductions depend on the
+        # window, which varies with the order workers finish in, so parallel searches run without them
+        self.lmr = lmr if workers == 1 else None
+        # Distinguishes this search from earlier ones in pool workers that outlive it
+        self.search_id = next(_search_ids)
+        # Resolve pending captures at the depth horizon instead of evaluating mid-exchange
+        self.quiescence = quiescence
+        # Carry alpha across root moves and test later moves with a null window (False: full window per move)
+        self.pvs_root = pvs_root
+        # The game's transposition table unless another (e.g. a shared one in a helper process) is given
+        self.table = table if table is not None else game.transposition_table
+        # Killer and history tables for move ordering, or None to search moves in generation order
+        self.orderer = MoveOrderer() if ordering else None
+        self.nodes = 0
+        # Score of the last completed iteration, the centre of the next aspiration window
+        self.previous_score = None
+        # perf_counter() time at which the search must stop, or None for no limit
+        self.deadline = None
+        # Event (with is_set()) that ends the search from outside when set, or None
+        self.stop = stop
+    
+    def count_node(self):
+        """Count a visited node and abort the search once the deadline has passed or a stop is requested."""
+        self.nodes += 1
+        if not self.nodes & (self.CHECK_INTERVAL - 1) and (
+                (self.deadline is not None and time.perf_counter() >= self.deadline)
+                or (self.stop is not None and self.stop.is_set())):
+            raise SearchTimeout
+    
+    def reduction(self, move, index, depth):
+        """Return how many plies to reduce the ``index``-th move searched at a node ``depth`` plies deep."""
+        lmr = self.lmr
+        # Captures, the early (hash, killer) moves and shallow nodes are never reduced
+        if lmr is None or move.captured or index < lmr.full_moves or depth < lmr.min_depth:
+            return 0
+        return min(lmr.reduction, depth - 1)
+
+def quiescence(ctx, position, alpha, beta, color):
+    """Search only capture sequences until the position is quiet, from the side to move's perspective.
+    
+    ``color`` is 1 with the AI to move and -1 with the player to move. A quiet
+    position scores its static evaluation. Captures are mandatory, so while one is
+    pending the side to move cannot stand pat: every capture is searched and the
+    best of them is the score. The caller counts this node.
+    """
+    moves = generate_moves(position, position.side)
+    # A side with no legal moves has lost
+    if not moves:
+        return -WIN_SCORE
+    # Captures are mandatory, so the first move tells whether any capture is pending
+    if not moves[0].captured:
+        return color * evaluate_board(ctx.game, position)
+    best_score = -float('inf')
+    # Longest capture chains first
+    moves.sort(key=lambda move: move.captured.bit_count(), reverse=True)
+    for move in moves:
+        ctx.count_node()
+        undo = make_move(position, move)
+        score = -quiescence(ctx, position, -beta, -alpha, -color)
+        unmake_move(position, undo)
+        if score > best_score:
+            best_score = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+    return best_score
+
+def search_root(ctx, depth, child_search, alpha=-float('inf'), beta=float('inf')):
+    """Search every AI move to ``depth`` within (alpha, beta) and return a RootResult.
+    
+    ``child_search(ctx, position, depth, alpha, beta)`` scores the position after a
+    root move from the AI's perspective. The first move is searched with the full
+    window; with ``ctx.pvs_root`` every later move is first searched with a null
+    window at the best score so far and re-searched only if it fails high. Scores of
+    moves that fail low are upper bounds; only the best move's score is exact, and
+    only if it lies inside (alpha, beta).
+    """
+    # Pack the game board into a bitboard position with the AI to move
+    position = Position.from_board(ctx.game.board, "ai")
+    moves = generate_moves(position, "ai")
+    # Search the previous iteration's best move first, then the rest in heuristic order
+    if ctx.orderer is not None:
+        entry = ctx.table.probe(position.key)
+        moves = ctx.orderer.order(moves, entry.move if entry is not None else None, 0)
+    
+    alpha_orig = alpha
+    best_score = -float('inf')
+    best_move = None
+    root_scores = []
+    for move in moves:
+        # Play the move in place, score it, then restore the position
+        undo = make_move(position, move)
+        if best_move is None or not ctx.pvs_root:
+            score = child_search(ctx, position, depth - 1, alpha, beta)
+        else:
+            # Null-window test: can this move beat the best score so far?
+            score = child_search(ctx, position, depth - 1, alpha, alpha + NULL_WINDOW)
+            if alpha < score < beta:
+                # Fail high inside the window: re-search with the full window to get the exact score
+                score = child_search(ctx, position, depth - 1, alpha, beta)
+        unmake_move(position, undo)
+        root_scores.append((move, score))
+        if score > best_score:
+            best_score = score
+            best_move = move
+            # Share the best score with the remaining root moves
+            if ctx.pvs_root:
+                alpha = max(alpha, score)
+            # Fail high against a narrowed window: the caller widens it and searches again
+            if score >= beta:
+                break
+    
+    # Remember the root result so the next iteration and search can start from it
+    store_result(ctx.table, position.key, depth, best_score, alpha_orig, beta, best_move)
+    return RootResult(best_move, best_score, principal_variation(ctx, position, best_move, depth), root_scores)
+
+def principal_variation(ctx, position, best_move, depth):
+    """Return the principal variation: the root best move followed by the stored best moves, up to ``depth`` moves."""
+    if best_move is None:
+        return []
+    pv = [best_move]
+    undos = [make_move(position, best_move)]
+    seen = {position.key}
+    while len(pv) < depth:
+        entry = ctx.table.probe(position.key)
+        if entry is None or entry.move is None or entry.move not in generate_moves(position, position.side):
+            break
+        pv.append(entry.move)
+        undos.append(make_move(position, entry.move))
+        # Stop on a repeated position so king shuffles cannot loop
+        if position.key in seen:
+            break
+        seen.add(position.key)
+    for undo in reversed(undos):
+        unmake_move(position, undo)
+    return pv
+
+def iterative_deepening(ctx, root_search, max_depth, time_limit_ms=None, start_depth=1):
+    """Run ``root_search(ctx, depth)`` for depth start_depth, start_depth + 1, ... until max_depth or the time limit.
+    
+    ``root_search`` returns a RootResult. The result of an iteration interrupted by the
+    deadline is discarded, and the first iteration always completes so a move is always found.
+    """
+    start = time.perf_counter()
+    result = None
+    for depth in range(start_depth, max_depth + 1):
+        try:
+            root = root_search(ctx, depth)
+        except SearchTimeout:
+            break
+        result = SearchResult(root.move, root.score, depth, ctx.nodes, time.perf_counter() - start,
+                              root.pv, root.root_scores)
+        ctx.previous_score = root.score
+        # No legal move: deeper iterations cannot change the result
+        if root.move is None:
+            break
+        if time_limit_ms is not None:
+            ctx.deadline = start + time_limit_ms / 1000
+            if time.perf_counter() >= ctx.deadline:
+                break
+    return result
@@ -0,0 +1,127 @@
+import struct
+import weakref
+from multiprocessing import shared_memory
+import numpy as np
+from movegen import MAX_PACKED_PATH, pack_move, unpack_move
+from transposition import TTEntry
+
+# One packed entry: check word (key XOR the three data words), score bits, depth/flag/generation, packed move
+_ENTRY = struct.Struct("<4Q")
+# Shared header: the generation, bumped by new_search in any process
+_HEADER = struct.Struct("<Q")
+_DOUBLE = struct.Struct("<d")
+_WORD = struct.Struct("<Q")
+
+def _attach(name):
+    """Attach to an existing shared memory block without taking ownership of it."""
+    try:
+        # Python 3.13+: leave the block to the creating process's resource tracker
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Older versions register it again; pool workers share their parent's tracker, so this is harmless
+        return shared_memory.SharedMemory(name=name)
+
+def _release(block, owner):
+    """Close a shared memory block, unlinking it if this process created it."""
+    block.close()
+    if owner:
+        block.unlink()
+
+class SharedTranspositionTable:
+    """Transposition table in shared memory, usable by several processes at once.
+    
+    Drop-in replacement for TranspositionTable. Entries are written without locks;
+    each stores its key XORed with its data words, so a read that interleaves with
+    another process's write fails the check and counts as a miss.
+    """
+    
+    ENTRY_BYTES = _ENTRY.size
+    
+    def __init__(self, size_mb=16, name=None):
+        # Largest power of two that fits the budget, so the slot index is a mask of the key
+        slots = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_BYTES)
+        self.size = 1 << (slots.bit_length() - 1)
+        self.mask = self.size - 1
+        # The creating process owns the block and unlinks it in close(); other processes attach by name
+        self.owner = name is None
+        if self.owner:
+            self.block = shared_memory.SharedMemory(create=True, size=_HEADER.size + self.size * self.ENTRY_BYTES)
+            self.block.buf[:] = bytes(len(self.block.buf))
+        else:
+            self.block = _attach(name)
+        self.name = self.block.name
+        self.buf = self.block.buf
+        # Release the block when the table is closed or garbage collected
+        self._finalizer = weakref.finalize(self, _release, self.block, self.owner)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+    
+    @classmethod
+    def attach(cls, name, size_mb=16):
+        """Open the table created by another process under ``name`` with the same ``size_mb``."""
+        return cls(size_mb, name)
+    
+    @property
+    def generation(self):
+        """Search generation shared by every process using the table."""
+        return _HEADER.unpack_from(self.buf, 0)[0]
+    
+    def new_search(self):
+        """Start a new search: age existing entries and reset this process's statistics."""
+        _HEADER.pack_into(self.buf, 0, self.generation + 1)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+    
+    def clear(self):
+        """Remove every entry."""
+        self.buf[_HEADER.size:] = bytes(self.size * self.ENTRY_BYTES)
+    
+    def probe(self, key):
+        """Return the entry stored for ``key``, or None."""
+        self.probes += 1
+        check, score, meta, path = _ENTRY.unpack_from(self.buf, _HEADER.size + (key & self.mask) * self.ENTRY_BYTES)
+        # Empty slots, other positions and torn writes all fail the check
+        if check ^ score ^ meta ^ path != key or not meta:
+            return None
+        self.hits += 1
+        score = _DOUBLE.unpack(_WORD.pack(score))[0]
+        return TTEntry(key, (meta & 0xFF) - 1, score, (meta >> 8) & 3, unpack_move(path),
+                       (meta >> 10) & 0xFFFF)
+    
+    def store(self, key, depth, score, flag, move):
+        """Store a search result, keeping a deeper entry from the current search over a shallower one."""
+        offset = _HEADER.size + (key & self.mask) * self.ENTRY_BYTES
+        check, old_score, old_meta, old_path = _ENTRY.unpack_from(self.buf, offset)
+        generation = self.generation & 0xFFFF
+        if old_meta and (old_meta >> 10) & 0xFFFF == generation and depth < (old_meta & 0xFF) - 1:
+            return
+        # Moves too long to pack (never seen in play) are stored as no move
+        path = pack_move(move) if move is None or len(move.path) <= MAX_PACKED_PATH else 0
+        # Keep the previous best move when a shallower re-search of the same position has none
+        if not path and old_meta and check ^ old_score ^ old_meta ^ old_path == key:
+            path = old_path
+        # Depth is stored plus one so a zero meta word marks an empty slot
+        meta = (depth + 1) | flag << 8 | generation << 10
+        score = _WORD.unpack(_DOUBLE.pack(score))[0]
+        _ENTRY.pack_into(self.buf, offset, key ^ score ^ meta ^ path, score, meta, path)
+        self.stores += 1
+    
+    def hit_rate(self):
+        """Return the fraction of probes since the last new_search that found their position."""
+        return self.hits / self.probes if self.probes else 0.0
+    
+    def usage(self):
+        """Return the fraction of slots in use."""
+        # The meta words of every slot as one array view; a zero meta word marks an empty slot
+        meta = np.frombuffer(self.buf, dtype="<u8", count=self.size * 4, offset=_HEADER.size)[2::4]
+        used = int(np.count_nonzero(meta))
+        # Drop the view before returning so close() can release the block
+        del meta
+        return used / self.size
+    
+    def close(self):
+        """Detach from the shared memory, and free it in the owning process."""
+        self.buf = None
+        self._finalizer()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from search import SearchContext, iterative_deepening, MAX_DEPTH
+from shared_transposition import SharedTranspositionTable
+
+# Helper process pools by helper count, each with the event that stops its searches
+_pools = {}
+
+# Per-process state of a helper: the stop event, a game to search from and the attached shared table
+_helper = {}
+
+def _init_helper(stop):
+    """Set up a helper process: remember the stop event and create the game it searches from."""
+    # Imported here because game_logic imports the engines that import this module
+    from game_logic import CheckersLogic
+    _helper["stop"] = stop
+    # Helpers only use the shared table, so the game's own table gets a single slot
+    _helper["game"] = CheckersLogic(0, "negamax", tt_size_mb=0)
+    _helper["table"] = None
+
+def get_pool(helpers):
+    """Return the process pool and stop event for ``helpers`` helper processes, starting them on first use."""
+    if helpers not in _pools:
+        stop = multiprocessing.Event()
+        pool = ProcessPoolExecutor(max_workers=helpers, initializer=_init_helper, initargs=(stop,))
+        _pools[helpers] = (pool, stop)
+    return _pools[helpers]
+
+def _helper_search(table_name, size_mb, board, root_search, helper, start_depth, lmr):
+    """Pool task: search the root until the stop event is set and return the number of nodes searched.
+    
+    Helpers differ from the main search and from each other: odd helpers start one
+    ply deeper, and each seeds its history table with its own noise so quiet moves
+    are tried in a different order.
+    """
+    table = _helper["table"]
+    if table is None or table.name != table_name:
+        if table is not None:
+            table.close()
+        table = _helper["table"] = SharedTranspositionTable.attach(table_name, size_mb)
+    game = _helper["game"]
+    game.board = board
+    ctx = SearchContext(game, lmr=lmr, table=table, stop=_helper["stop"])
+    rng = random.Random(helper)
+    for row in ctx.orderer.history:
+        for dst in range(len(row)):
+            row[dst] = rng.randrange(4)
+    # Stopped by the event, which surfaces as a timeout inside iterative deepening
+    iterative_deepening(ctx, root_search, MAX_DEPTH, start_depth=start_depth + helper % 2)
+    return ctx.nodes
+
+def lazy_smp(ctx, root_search, max_depth, time_limit_ms=None, start_depth=1):
+    """Iterative deepening with ``ctx.game.ai_workers - 1`` helper processes searching the same root.
+    
+    Takes the same arguments as ``iterative_deepening`` and returns its result for
+    this process's search. The helpers share nothing but the transposition table,
+    which must be a SharedTranspositionTable: their entries give the main search
+    cutoffs and move orders it has not found itself.
+    """
+    table = ctx.table
+    pool, stop = get_pool(ctx.game.ai_workers - 1)
+    stop.clear()
+    helpers = [pool.submit(_helper_search, table.name, table.size * table.ENTRY_BYTES / (1024 * 1024),
+                           ctx.game.board, root_search, helper, start_depth, ctx.lmr)
+               for helper in range(1, ctx.game.ai_workers)]
+    try:
+        return iterative_deepening(ctx, root_search, max_depth, time_limit_ms, start_depth)
+    finally:
+        stop.set()
+        for helper in helpers:
+            helper.result()
\ No newline at end of file
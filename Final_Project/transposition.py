@@ -0,0 +1,98 @@
+from collections import namedtuple
+
+# Bound types: the stored score is exact, a lower bound (fail high) or an upper bound (fail low)
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Scores are stored from the perspective of the side to move, so minimax and negamax can share a table
+TTEntry = namedtuple("TTEntry", ["key", "depth", "score", "flag", "move", "generation"])
+
+class TranspositionTable:
+    """Fixed-size transposition table keyed by Zobrist hash with depth-preferred replacement."""
+    
+    # Memory of one full slot: list pointer, entry tuple, key int, score float and the stored Move with its
+    # path tuple. Measured with tracemalloc at about 300 bytes per slot on a full table; rounded up so larger
+    # capture moves stay within the budget
+    ENTRY_BYTES = 320
+    
+    def __init__(self, size_mb=16):
+        # Largest power of two that fits the budget, so the slot index is a mask of the key
+        slots = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_BYTES)
+        self.size = 1 << (slots.bit_length() - 1)
+        self.mask = self.size - 1
+        self.entries = [None] * self.size
+        # Bumped once per AI move so entries from earlier searches can always be replaced
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+    
+    def new_search(self):
+        """Start a new search: age existing entries and reset the statistics."""
+        self.generation += 1
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+    
+    def clear(self):
+        """Remove every entry."""
+        self.entries = [None] * self.size
+    
+    def probe(self, key):
+        """Return the entry stored for ``key``, or None."""
+        self.probes += 1
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        return None
+    
+    def store(self, key, depth, score, flag, move):
+        """Store a search result, keeping a deeper entry from the current search over a shallower one."""
+        index = key & self.mask
+        entry = self.entries[index]
+        if entry is None or entry.generation != self.generation or depth >= entry.depth:
+            # Keep the previous best move when a shallower re-search of the same position has none
+            if move is None and entry is not None and entry.key == key:
+                move = entry.move
+            self.entries[index] = TTEntry(key, depth, score, flag, move, self.generation)
+            self.stores += 1
+    
+    def hit_rate(self):
+        """Return the fraction of probes since the last new_search that found their position."""
+        return self.hits / self.probes if self.probes else 0.0
+    
+    def usage(self):
+        """Return the fraction of slots in use."""
+        return sum(entry is not None for entry in self.entries) / self.size
+
+def probe_window(table, key, depth, alpha, beta):
+    """Probe ``table`` for a node searched ``depth`` deep in (alpha, beta); return (entry, cutoff, alpha, beta).
+    
+    Scores and the window are from the side to move's perspective. ``entry`` is the
+    stored entry or None, whatever its depth, for its move. An entry searched at least
+    ``depth`` deep narrows the window by its bound, and ``cutoff`` is the score to
+    return when it ends the search (exact, or the window closed); otherwise None.
+    """
+    entry = table.probe(key)
+    if entry is not None and entry.depth >= depth:
+        if entry.flag == EXACT:
+            return entry, entry.score, alpha, beta
+        if entry.flag == LOWER:
+            alpha = max(alpha, entry.score)
+        else:
+            beta = min(beta, entry.score)
+        if alpha >= beta:
+            return entry, entry.score, alpha, beta
+    return entry, None, alpha, beta
+
+def store_result(table, key, depth, score, alpha, beta, move):
+    """Store a node's ``score`` as exact or as the bound implied by the window (alpha, beta) it was searched with."""
+    if score <= alpha:
+        flag = UPPER
+    elif score >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    table.store(key, depth, score, flag, move)
@@ -1,3 +1,9 @@
+from bitboard import Position, ROW_MASKS, CENTER_MASK, BOARD_SIZE
+from movegen import has_moves
+
+# Score of a won position, far above any material evaluation
+WIN_SCORE = 1000
+
 class Constants:
     """Game constants for colors and dimensions."""
     PADDING = 20
@@ -13,6 +19,9 @@ class Constants:
 
 def evaluate_board(game, board):
     """Evaluate board from AI's perspective."""
+    if isinstance(board, Position):
+        return evaluate_position(board)
+    
     ai_score = 0
     player_score = 0
     
@@ -42,6 +51,12 @@ def evaluate_board(game, board):
 
 def is_terminal(game, board):
     """Check if board state is terminal."""
+    if isinstance(board, Position):
+        # The side to move loses when it has no pieces (checked in constant time) or no legal move
+        if not board.piece_squares[board.side]:
+            return True
+        return not has_moves(board, board.side)
+    
     player_pieces = any(board[r][c] in (1, 3) for r in range(game.board_size) for c in range(game.board_size))
     ai_pieces = any(board[r][c] in (2, 4) for r in range(game.board_size) for c in range(game.board_size))
     if not player_pieces or not ai_pieces:
@@ -51,4 +66,22 @@ def is_terminal(game, board):
                    for r in range(game.board_size) for c in range(game.board_size) if board[r][c] in (2, 4))
     player_moves = any(game.get_valid_moves_for_board(board, r, c)
                        for r in range(game.board_size) for c in range(game.board_size) if board[r][c] in (1, 3))
-    return not ai_moves or not player_moves
\ No newline at end of file
+    return not ai_moves or not player_moves
+
+def evaluate_position(position):
+    """Evaluate a bitboard position from AI's perspective, matching evaluate_board."""
+    black_men = position.black & ~position.kings
+    white_men = position.white & ~position.kings
+    
+    player_score = position.man_count["player"] + position.king_count["player"] * 1.5
+    ai_score = position.man_count["ai"] + position.king_count["ai"] * 1.5
+    
+    # Men gain 0.1 for every row advanced towards promotion
+    for row, mask in enumerate(ROW_MASKS):
+        player_score += (black_men & mask).bit_count() * (BOARD_SIZE - 1 - row) * 0.1
+        ai_score += (white_men & mask).bit_count() * row * 0.1
+    
+    player_score += (position.black & CENTER_MASK).bit_count() * 0.2
+    ai_score += (position.white & CENTER_MASK).bit_count() * 0.2
+    
+    return ai_score - player_score
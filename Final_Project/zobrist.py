@@ -0,0 +1,30 @@
+import random
+
+# Fixed seed so keys, and therefore cached positions, are identical across runs and processes
+_rng = random.Random(0x5EED_C4EC)
+
+# PIECE_KEYS[piece][square] for piece codes 0-4 on the 32 dark squares; empty squares hash to 0
+PIECE_KEYS = [[0] * 32] + [[_rng.getrandbits(64) for _ in range(32)] for _ in range(4)]
+# XORed in when the player (black) is to move
+SIDE_KEY = _rng.getrandbits(64)
+
+def hash_pieces(black, white, kings, side):
+    """Compute the Zobrist key of a bitboard position from scratch."""
+    key = SIDE_KEY if side == "player" else 0
+    for sq in range(32):
+        bit = 1 << sq
+        if black & bit:
+            key ^= PIECE_KEYS[3 if kings & bit else 1][sq]
+        elif white & bit:
+            key ^= PIECE_KEYS[4 if kings & bit else 2][sq]
+    return key
+
+def hash_board(board, side="ai"):
+    """Compute the Zobrist key of an 8x8 NumPy board as used by CheckersLogic."""
+    key = SIDE_KEY if side == "player" else 0
+    for row in range(8):
+        for col in range(1 - row % 2, 8, 2):
+            piece = board[row][col]
+            if piece:
+                key ^= PIECE_KEYS[piece][row * 4 + col // 2]
+    return key